@@ -50,6 +50,7 @@ class ArtBrain(object):
             states += self.ih[instruction].brain.fsm.states
             transitions += self.ih[instruction].brain.fsm.transitions
         self.fsm = ArtBrainMachine(states, transitions)
+        rospy.logdebug(self.ih.import_report())
 
         for instruction in self.ih.known_instructions():
             self.instruction_fsm[instruction] = self.ih[instruction].brain.fsm(self)
@@ -3,7 +3,7 @@ import rospy
 import jsonpickle
 from art_msgs.msg import InstancesArray
 from std_msgs.msg import String
-from art_msgs.srv import getObjectTypeRequest, getObjectType
+from art_db import ArtDbClient
 
 
 class BridgeToJsonMsg:
@@ -11,10 +11,10 @@ class BridgeToJsonMsg:
     def __init__(self):
         rospy.Subscriber("/art/object_detector/object_filtered", InstancesArray, self.callback)
         self.pub = rospy.Publisher("/objects_string", String, queue_size=1)
-        rospy.loginfo("Waiting for /art/db/object_type/get service")
-        rospy.wait_for_service("/art/db/object_type/get")
-        rospy.loginfo("Service /art/db/object_type/get found")
-        self.get_object_type_srv = rospy.ServiceProxy("/art/db/object_type/get", getObjectType)
+        rospy.loginfo("Waiting for /art/db/object_types/get service")
+        self.db = ArtDbClient()
+        self.db.wait_for_db()
+        rospy.loginfo("Service /art/db/object_types/get found")
         rospy.spin()
 
     def callback(self, detected_object):
@@ -24,6 +24,12 @@ class BridgeToJsonMsg:
         """
 
         objects = []
+
+        # types of all objects are fetched at once
+        object_types = self.db.get_object_types(set(obj.object_type for obj in detected_object.instances))
+        if object_types is None:
+            return
+
         for obj in detected_object.instances:
             '''to_json = {'name': obj.object_id, 'pose': {'position': {'x': obj.pose.position.x,
                                                                          'y': obj.pose.position.y,
@@ -32,11 +38,8 @@ class BridgeToJsonMsg:
                                                                             'y': obj.pose.orientation.y,
                                                                             'z': obj.pose.orientation.z,
                                                                             'w': obj.pose.orientation.w}}}'''
-            req = getObjectTypeRequest()
-            req.name = obj.object_type
-            resp = self.get_object_type_srv.call(req)
-            if not resp.success:
-                rospy.logwarn("Object type " + str(req.name) + " not in DB, skipping")
+            if obj.object_type not in object_types:
+                rospy.logwarn("Object type " + str(obj.object_type) + " not in DB, skipping")
                 continue
             # TODO publikuje se automaticky Z poloha na 0.023 .. opravit
             to_json = {'name': obj.object_id,
@@ -48,9 +51,9 @@ class BridgeToJsonMsg:
                                        'y': obj.pose.orientation.y,
                                        'z': obj.pose.orientation.z,
                                        'w': obj.pose.orientation.w},
-                       'bbox': {'x': resp.object_type.bbox.dimensions[0],
-                                'y': resp.object_type.bbox.dimensions[1],
-                                'z': resp.object_type.bbox.dimensions[2]}}
+                       'bbox': {'x': object_types[obj.object_type].bbox.dimensions[0],
+                                'y': object_types[obj.object_type].bbox.dimensions[1],
+                                'z': object_types[obj.object_type].bbox.dimensions[2]}}
             objects.append(to_json)
         self.pub.publish(jsonpickle.encode(objects))
 
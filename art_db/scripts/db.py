@@ -0,0 +1,931 @@
+#!/usr/bin/env python
+
+from art_msgs.msg import Program, ProgramHeader, ObjectType, CollisionPrimitive
+from art_msgs.srv import getProgram, getProgramResponse, getProgramHeaders, getProgramHeadersResponse, \
+    storeProgram, storeProgramResponse, getObjectType, getObjectTypeResponse, storeObjectType, storeObjectTypeResponse,\
+    ProgramIdTrigger, ProgramIdTriggerResponse, GetCollisionPrimitives, GetCollisionPrimitivesResponse,\
+    AddCollisionPrimitive, AddCollisionPrimitiveResponse, ClearCollisionPrimitives, ClearCollisionPrimitivesResponse
+import sys
+import rospy
+from art_helpers import ProgramHelper
+from art_db import LRUCache, StorageError, create_storage, RWLock, KeyedRWLock, LockWaitStats, program_delta, \
+    build_program, ServiceMetrics, TimedStorage
+from art_db.msg import DbChange, ProgramDelta
+from art_db.srv import getObjectTypes, getObjectTypesResponse, getPrograms, getProgramsResponse, \
+    storeObjectTypes, storeObjectTypesResponse, storePrograms, storeProgramsResponse, getProgramRevision, \
+    getProgramRevisionResponse
+from std_srvs.srv import Trigger, TriggerResponse
+from diagnostic_msgs.msg import DiagnosticArray
+from copy import deepcopy
+import threading
+import time
+
+
+class ArtDB:
+
+    """Provides access to ARTable persistent storage (programs, object types, collision primitives).
+
+    Content of the DB is cached in memory (write-through) - object types and collision primitives completely,
+    programs in LRU cache of limited size.
+
+    Program headers are stored also separately (as ProgramHeader messages) and indexed by program id, so
+    listing programs does not require loading whole programs.
+
+    Storage backend is selected by ~storage parameter: "mongo" (mongodb_store) or "sqlite" (local file given by
+    ~sqlite_path parameter).
+
+    Programs are locked per program id, object types and collision primitives per collection (readers-writer locks),
+    so e.g. storing a program does not block reading of object types. Object types found in the cache are returned
+    without locking at all. Time spent waiting for locks is recorded per service (see /art/db/lock/stats).
+
+    Each change is announced on /art/db/changes topic (DbChange), so clients can keep their own caches.
+
+    Programs are stored as revisions (ProgramDelta) - each store writes only changed blocks and items. Every
+    ~program_compaction_interval revisions, complete program is written instead, and then revisions older than
+    ~program_history (0 for unlimited history) are removed. Any kept revision can be obtained using
+    /art/db/program/revision/get. Programs are loaded (built from revisions) only when requested.
+
+    Programs stored before revisions were introduced (Program messages) are converted to revisions when they are
+    loaded for the first time. The original messages are kept in the DB (an older art_db would see them in
+    the state before the conversion).
+
+    Each service call is measured (count, latency split into lock wait, storage and validation time, payload sizes,
+    callers) and the metrics are published on /art/db/metrics (DiagnosticArray) every ~metrics_period seconds.
+    Calls taking more than ~slow_call_threshold seconds are logged together with their request.
+
+    """
+
+    def __init__(self):
+
+        slow_threshold = rospy.get_param("~slow_call_threshold", 0.1)
+        self.metrics = ServiceMetrics(slow_threshold if slow_threshold > 0 else None)
+
+        self.db = TimedStorage(create_storage(rospy.get_param("~storage", "mongo"),
+                                              rospy.get_param("~sqlite_path", "art_db.sqlite")), self.metrics)
+
+        self.program_locks = KeyedRWLock()  # program id -> RWLock
+        self.headers_lock = RWLock()  # always acquired after program lock(s)
+        self.object_types_lock = RWLock()
+        self.primitives_lock = RWLock()
+        self.lock_stats = LockWaitStats(lambda wait: self.metrics.add("lock", wait))
+
+        self.object_types = LRUCache()  # name -> ObjectType
+        self.programs = LRUCache(rospy.get_param("~program_cache_size", 32))  # id -> Program
+        self.primitives = LRUCache()  # (setup, name) -> CollisionPrimitive
+        self.primitives_complete = False  # all primitives are in the cache
+        self.headers = {}  # program id -> ProgramHeader
+        self.headers_complete = False
+        self.revisions = {}  # program id -> [(revision, full), ...]
+        self.compaction_interval = rospy.get_param("~program_compaction_interval", 20)
+        self.history = rospy.get_param("~program_history", 100)
+
+        # revision is initialized from time, so it increases also across restarts
+        self.revision = int(time.time() * 1e6)
+        self.revision_lock = threading.Lock()
+        self.changes_pub = rospy.Publisher('/art/db/changes', DbChange, queue_size=100)
+
+        self._warm_up()
+
+        self.srv_get_program = self._service('/art/db/program/get', getProgram, self.srv_get_program_cb)
+        self.srv_get_program_headers = self._service('/art/db/program_headers/get',
+                                                      getProgramHeaders,
+                                                      self.srv_get_program_headers_cb)
+
+        self.srv_store_program = self._service('/art/db/program/store', storeProgram, self.srv_store_program_cb)
+        self.srv_get_programs = self._service('/art/db/programs/get', getPrograms, self.srv_get_programs_cb)
+        self.srv_store_programs = self._service('/art/db/programs/store', storePrograms, self.srv_store_programs_cb)
+        self.srv_delete_program = self._service('/art/db/program/delete', ProgramIdTrigger, self.srv_delete_program_cb)
+        self.srv_get_program_revision = self._service('/art/db/program/revision/get', getProgramRevision,
+                                                       self.srv_get_program_revision_cb)
+        self.srv_ro_set_program = self._service('/art/db/program/readonly/set',
+                                                 ProgramIdTrigger,
+                                                 self.srv_ro_set_program_cb)
+        self.srv_ro_clear_program = self._service('/art/db/program/readonly/clear', ProgramIdTrigger,
+                                                   self.srv_ro_clear_program_cb)
+
+        self.srv_get_object = self._service('/art/db/object_type/get', getObjectType, self.srv_get_object_cb)
+        self.srv_store_object = self._service('/art/db/object_type/store', storeObjectType, self.srv_store_object_cb)
+        self.srv_get_objects = self._service('/art/db/object_types/get', getObjectTypes, self.srv_get_objects_cb)
+        self.srv_store_objects = self._service('/art/db/object_types/store', storeObjectTypes,
+                                                self.srv_store_objects_cb)
+
+        self.srv_get_collision_primitives = self._service('/art/db/collision_primitives/get', GetCollisionPrimitives,
+                                                           self.srv_get_collision_primitives_cb)
+        self.srv_add_collision_primitive = self._service('/art/db/collision_primitives/add', AddCollisionPrimitive,
+                                                          self.srv_add_collision_primitive_cb)
+        self.srv_clear_collision_primitive = self._service('/art/db/collision_primitives/clear',
+                                                            ClearCollisionPrimitives,
+                                                            self.srv_clear_collision_primitives_cb)
+
+        self.srv_cache_stats = self._service('/art/db/cache/stats', Trigger, self.srv_cache_stats_cb)
+        self.srv_lock_stats = self._service('/art/db/lock/stats', Trigger, self.srv_lock_stats_cb)
+
+        self.metrics_pub = rospy.Publisher('/art/db/metrics', DiagnosticArray, queue_size=1, latch=True)
+        metrics_period = rospy.get_param("~metrics_period", 10.0)
+
+        if metrics_period > 0:
+            self.metrics_timer = rospy.Timer(rospy.Duration(metrics_period), self.metrics_timer_cb)
+
+        rospy.loginfo('art_db ready')
+
+    def _service(self, name, srv_type, handler):
+        """Advertises service, which calls are recorded in metrics (under name without /art/db/ prefix)."""
+
+        return rospy.Service(name, srv_type, self.metrics.wrap(name.replace('/art/db/', '', 1), handler))
+
+    def metrics_timer_cb(self, evt):
+
+        self.metrics_pub.publish(self.metrics.diagnostics())
+
+    def _warm_up(self):
+        """Fills caches with content of the DB."""
+
+        try:
+
+            for ot in self.db.query(ObjectType):
+                self.object_types.put(ot.name, ot)
+
+            for prim in self.db.query(CollisionPrimitive):
+                self.primitives.put((prim.setup, prim.name), prim)
+
+            self.primitives_complete = True
+
+            for header in self.db.query(ProgramHeader):
+                self.headers[header.id] = header
+
+            # DB from the time when headers were not stored separately
+            if not self.headers:
+                for prog in self.db.query(Program):
+                    self._backfill_header(prog.header)
+
+            self.headers_complete = True
+
+        except StorageError as e:
+            rospy.logerr("Failed to fill caches: " + str(e))
+
+        rospy.loginfo("Cached " + str(len(self.object_types)) + " object types, " + str(len(self.primitives)) +
+                      " collision primitives and " + str(len(self.headers)) + " program headers.")
+
+    def _backfill_header(self, header):
+
+        # programs stored before headers were stored separately
+        if header.id not in self.headers:
+            rospy.loginfo("Storing header of program " + str(header.id))
+            if not self._store_header(header):
+                self.headers[header.id] = header
+
+    def _store_header(self, header):
+
+        if self.db.put("program_header:" + str(header.id), header):
+
+            with self.headers_lock.write():
+                self.headers[header.id] = header
+
+            return True
+
+        return False
+
+    def _delete_header(self, program_id):
+
+        with self.headers_lock.write():
+            self.headers.pop(program_id, None)
+
+        self.db.delete(ProgramHeader, "program_header:" + str(program_id))
+
+    def _notify(self, kind, action, entity_id, setup=""):
+
+        with self.revision_lock:
+
+            self.revision += 1
+            self.changes_pub.publish(DbChange(kind=kind, action=action, id=str(entity_id), setup=setup,
+                                              revision=self.revision))
+
+    def srv_cache_stats_cb(self, req):
+
+        stats = (("object_types", self.object_types), ("programs", self.programs),
+                 ("collision_primitives", self.primitives))
+
+        return TriggerResponse(success=True, message=", ".join(
+            name + ": " + " ".join(k + "=" + str(v) for k, v in sorted(cache.stats().items()))
+            for name, cache in stats))
+
+    def srv_lock_stats_cb(self, req):
+
+        return TriggerResponse(success=True, message=self.lock_stats.report())
+
+    def srv_clear_collision_primitives_cb(self, req):
+
+        resp = ClearCollisionPrimitivesResponse(success=False)
+
+        with self.lock_stats.locked("collision_primitives/clear", [self.primitives_lock.write()]):
+            return self._clear_collision_primitives(req, resp)
+
+    def _clear_collision_primitives(self, req, resp):
+        """Removes primitives with given names from given setup (all primitives of the setup if no name is given,
+        all primitives at all if setup is empty as well)."""
+
+        names = [name for name in req.names if name != ""]
+
+        if len(names) != len(req.names):
+            rospy.logwarn("Ignoring empty name.")
+
+        if req.names and not names:
+            resp.success = True
+            return resp
+
+        try:
+            # all primitives are removed by one storage operation
+            deleted = self.db.delete_query(CollisionPrimitive, keys=names or None,
+                                           setup=req.setup if names or req.setup else None)
+        except StorageError as e:
+
+            rospy.logerr("Service call failed: " + str(e))
+            return resp
+
+        if names:
+
+            for name in set(names) - set(prim.name for prim in deleted):
+                rospy.logwarn("Unknown primitive name: " + name)
+
+        else:
+
+            rospy.loginfo("Removed " + str(len(deleted)) + " collision primitives.")
+
+        for prim in deleted:
+
+            self.primitives.pop((prim.setup, prim.name))
+            self._notify(DbChange.COLLISION_PRIMITIVE, DbChange.DELETED, prim.name, prim.setup)
+
+        resp.success = True
+        return resp
+
+    def srv_add_collision_primitive_cb(self, req):
+
+        resp = AddCollisionPrimitiveResponse(success=False)
+
+        if req.primitive.name == "":
+            rospy.logerr("Empty primitive name!")
+            return resp
+
+        if req.primitive.setup == "":
+            rospy.logerr("Empty setup name!")
+            return resp
+
+        with self.lock_stats.locked("collision_primitives/add", [self.primitives_lock.write()]):
+
+            try:
+                resp.success = self.db.put(self._primitive_name(req.primitive.setup, req.primitive.name),
+                                           req.primitive)
+            except StorageError as e:
+                rospy.logerr("Service call failed: " + str(e))
+                return resp
+
+            if resp.success:
+                self.primitives.put((req.primitive.setup, req.primitive.name), req.primitive)
+                self._notify(DbChange.COLLISION_PRIMITIVE, DbChange.STORED, req.primitive.name, req.primitive.setup)
+
+        return resp
+
+    @staticmethod
+    def _primitive_name(setup, name):
+
+        return "collision_primitive_" + name + "_" + setup
+
+    def srv_get_collision_primitives_cb(self, req):
+
+        resp = GetCollisionPrimitivesResponse()
+
+        with self.lock_stats.locked("collision_primitives/get", [self.primitives_lock.read()]):
+
+            for name in req.names:
+
+                if name == "":
+                    rospy.logwarn("Ignoring empty name.")
+                    continue
+
+                prim = self.primitives.get((req.setup, name))
+
+                if prim is None and not self.primitives_complete:
+
+                    prim = self.db.get(CollisionPrimitive, self._primitive_name(req.setup, name))
+
+                    if prim is not None:
+                        self.primitives.put((req.setup, name), prim)
+
+                if prim is None:
+                    rospy.logwarn("Unknown primitive name: " + name)
+                    continue
+
+                resp.primitives.append(prim)
+
+            if not req.names:
+
+                if self.primitives_complete:
+
+                    for prim in self.primitives.values():
+                        if prim.setup == req.setup:
+                            resp.primitives.append(prim)
+
+                else:
+
+                    resp.primitives = self.db.query(CollisionPrimitive, setup=req.setup)
+
+        return resp
+
+    def _program_set_ro(self, program_id, ro):
+
+        with self.lock_stats.locked("program/readonly", self.program_locks.write(program_id)):
+
+            resp = ProgramIdTriggerResponse()
+            resp.success = False
+
+            try:
+                prog = self._get_program(program_id)
+            except StorageError as e:
+                resp.error = str(e)
+                return resp
+
+            if not prog:
+                resp.error = "Program does not exist"
+                return resp
+
+            # cached instance might be just being sent to someone
+            prog = deepcopy(prog)
+            prog.header.readonly = ro
+
+            try:
+                resp.success = self._put_program(prog, DbChange.READONLY_SET if ro else DbChange.READONLY_CLEARED)
+            except StorageError as e:
+                resp.error = str(e)
+
+            return resp
+
+    def srv_ro_set_program_cb(self, req):
+
+        return self._program_set_ro(req.program_id, True)
+
+    def srv_ro_clear_program_cb(self, req):
+
+        return self._program_set_ro(req.program_id, False)
+
+    def srv_get_program_headers_cb(self, req):
+
+        resp = getProgramHeadersResponse()
+
+        if not self.headers_complete:
+
+            with self.lock_stats.locked("program_headers/get", [self.headers_lock.write()]):
+
+                try:
+                    for header in self.db.query(ProgramHeader):
+                        self.headers[header.id] = header
+                    self.headers_complete = True
+                except StorageError as e:
+                    print "Service call failed: " + str(e)
+                    return resp
+
+        with self.lock_stats.locked("program_headers/get", [self.headers_lock.read()]):
+
+            if req.ids:
+
+                for program_id in req.ids:
+                    if program_id in self.headers:
+                        resp.headers.append(self.headers[program_id])
+
+            else:
+
+                resp.headers = [self.headers[k] for k in sorted(self.headers.keys())]
+
+            return resp
+
+    def srv_delete_program_cb(self, req):
+
+        with self.lock_stats.locked("program/delete", self.program_locks.write(req.program_id)):
+
+            resp = ProgramIdTriggerResponse()
+            resp.success = False
+
+            try:
+
+                # whole history of the program is deleted (and program stored before revisions were introduced)
+                deleted = self.db.delete_query(ProgramDelta, keys=[req.program_id])
+                deleted = self.db.delete(Program, "program:" + str(req.program_id)) or deleted
+
+                if deleted:
+                    resp.success = True
+                    self.programs.pop(req.program_id)
+                    self.revisions.pop(req.program_id, None)
+
+                    # header has to be removed from the index before subscribers are notified
+                    try:
+                        self._delete_header(req.program_id)
+                    finally:
+                        self._notify(DbChange.PROGRAM, DbChange.DELETED, req.program_id)
+            except StorageError as e:
+                pass
+
+            return resp
+
+    def srv_get_program_cb(self, req):
+
+        with self.lock_stats.locked("program/get", self.program_locks.read(req.id)):
+
+            resp = getProgramResponse()
+            resp.success = False
+            name = "program:" + str(req.id)
+
+            prog = None
+
+            try:
+                prog = self._get_program(req.id)
+            except StorageError as e:
+                print "Service call failed: " + str(e)
+
+            if prog is not None:
+
+                resp.program = prog
+                resp.success = True
+
+            return resp
+
+    def srv_store_program_cb(self, req):
+
+        resp = storeProgramResponse()
+        resp.success = False
+
+        # validation does not need any lock
+        if not self._program_valid(req.program):
+            resp.error = "Invalid program"
+            return resp
+
+        with self.lock_stats.locked("program/store", self.program_locks.write(req.program.header.id)):
+
+            try:
+
+                if self._program_readonly(req.program.header.id):
+                    resp.error = "Readonly program."
+                    return resp
+
+                resp.success = self._put_program(req.program)
+
+            except StorageError as e:
+                print "Service call failed: " + str(e)
+
+            return resp
+
+    def srv_store_programs_cb(self, req):
+        """Stores all given programs - or none of them, if any of them is readonly or invalid or storing fails
+        (revisions already stored by the call are removed)."""
+
+        resp = storeProgramsResponse()
+        resp.success = False
+
+        for prog in req.programs:
+
+            if not self._program_valid(prog):
+                resp.error = "Program " + str(prog.header.id) + ": Invalid program"
+                return resp
+
+        with self.lock_stats.locked("programs/store",
+                                    self.program_locks.write(*[prog.header.id for prog in req.programs])):
+
+            try:
+                for prog in req.programs:
+
+                    if self._program_readonly(prog.header.id):
+                        resp.error = "Program " + str(prog.header.id) + ": Readonly program."
+                        return resp
+
+            except StorageError as e:
+                resp.error = str(e)
+                return resp
+
+            stored = []  # (program id, program before the change)
+
+            try:
+
+                for prog in req.programs:
+
+                    old = self._get_program(prog.header.id)
+
+                    # old revisions are removed only when the whole batch is stored (revert needs them)
+                    if not self._store_revision(prog, compact=False):
+                        raise StorageError("Failed to store program " + str(prog.header.id))
+
+                    stored.append((prog.header.id, old))
+
+            except StorageError as e:
+                self._revert_revisions(stored)
+                resp.error = str(e)
+                return resp
+
+            for program_id, _ in stored:
+                if self.revisions[program_id][-1][1]:
+                    self._compact(program_id)
+
+            # headers and notifications only when all programs are stored
+            for prog in req.programs:
+
+                try:
+                    self._store_header(prog.header)
+                except StorageError as e:
+                    rospy.logerr("Failed to store header of program " + str(prog.header.id) + ": " + str(e))
+
+                self._notify(DbChange.PROGRAM, DbChange.STORED, prog.header.id)
+
+            resp.success = True
+            return resp
+
+    def _revert_revisions(self, stored):
+        """Removes the latest revisions of given programs (stored by unfinished batch). Caller has to hold (write)
+        locks of the programs."""
+
+        for program_id, old in reversed(stored):
+
+            revisions = self.revisions[program_id]
+
+            try:
+                self.db.delete(ProgramDelta, self._delta_name(program_id, revisions[-1][0]))
+            except StorageError as e:
+                rospy.logerr("Failed to revert program " + str(program_id) + ": " + str(e))
+
+            self.revisions[program_id] = revisions[:-1]
+
+            if old is None:
+                self.programs.pop(program_id)
+            else:
+                self.programs.put(program_id, old)
+
+    def _program_valid(self, prog):
+
+        with self.metrics.phase("validation"):
+
+            ph = ProgramHelper()
+            return ph.load(prog)
+
+    def _program_readonly(self, program_id):
+        """Caller has to hold lock of the program."""
+
+        stored = self._get_program(program_id)
+        return stored is not None and stored.header.readonly
+
+    def _put_program(self, prog, action=DbChange.STORED):
+
+        if not self._store_revision(prog):
+            return False
+
+        self._store_header(prog.header)
+        self._notify(DbChange.PROGRAM, action, prog.header.id)
+        return True
+
+    @staticmethod
+    def _delta_name(program_id, revision):
+
+        return "program_delta:" + str(program_id) + ":" + str(revision)
+
+    def _get_revisions(self, program_id):
+        """Caller has to hold lock of the program."""
+
+        if program_id not in self.revisions:
+            self._load_program(program_id)
+
+        return self.revisions[program_id]
+
+    def _store_revision(self, prog, compact=True):
+        """Stores new revision of the program. Caller has to hold (write) lock of the program.
+
+        Args:
+            compact (bool): Remove old revisions when full revision is stored (see _compact).
+        """
+
+        program_id = prog.header.id
+        revisions = self._get_revisions(program_id)
+
+        since_full = 0
+
+        for _, full in reversed(revisions):
+            if full:
+                break
+            since_full += 1
+
+        old = self._get_program(program_id) if revisions else None
+        full = old is None or since_full + 1 >= self.compaction_interval
+
+        delta = program_delta(None if full else old, prog)
+        delta.revision = revisions[-1][0] + 1 if revisions else 1
+        delta.stamp = rospy.Time.now()
+
+        if not self.db.put(self._delta_name(program_id, delta.revision), delta):
+            return False
+
+        self.revisions[program_id] = revisions + [(delta.revision, full)]
+        self.programs.put(program_id, prog)
+
+        if full and compact:
+            self._compact(program_id)
+
+        return True
+
+    def _compact(self, program_id):
+        """Removes revisions older than history limit (except those needed to build the kept ones)."""
+
+        revisions = self.revisions[program_id]
+
+        if self.history <= 0 or len(revisions) <= self.history:
+            return
+
+        oldest = revisions[-self.history][0]
+        bases = [rev for rev, full in revisions if full and rev <= oldest]
+
+        if not bases:
+            return
+
+        base = bases[-1]
+
+        for rev, _ in revisions:
+
+            if rev >= base:
+                break
+
+            try:
+                self.db.delete(ProgramDelta, self._delta_name(program_id, rev))
+            except StorageError as e:
+                rospy.logerr("Failed to remove old revision: " + str(e))
+                break
+
+            self.revisions[program_id] = self.revisions[program_id][1:]
+
+    def _load_program(self, program_id, revision=None):
+        """Builds program from its stored revisions (None if it does not exist). Caller has to hold lock of
+        the program."""
+
+        deltas = sorted(self.db.query(ProgramDelta, keys=[program_id]), key=lambda d: d.revision)
+
+        if not deltas:
+            deltas = self._convert_legacy(program_id)
+
+        self.revisions[program_id] = [(d.revision, d.full) for d in deltas]
+
+        return build_program(deltas, revision)
+
+    def _convert_legacy(self, program_id):
+        """Stores program saved before revisions were introduced as its first revision (original message is kept).
+        Returns list of deltas (empty if there is no such program). Caller has to hold lock of the program."""
+
+        prog = self.db.get(Program, "program:" + str(program_id))
+
+        if prog is None:
+            return []
+
+        rospy.loginfo("Converting program " + str(program_id) + " to revisions")
+
+        delta = program_delta(None, prog)
+        delta.revision = 1
+        delta.stamp = rospy.Time.now()
+
+        if not self.db.put(self._delta_name(program_id, delta.revision), delta):
+            raise StorageError("Failed to convert program " + str(program_id))
+
+        return [delta]
+
+    def srv_get_program_revision_cb(self, req):
+
+        with self.lock_stats.locked("program/revision/get", self.program_locks.read(req.id)):
+
+            resp = getProgramRevisionResponse()
+            resp.success = False
+
+            try:
+
+                resp.revisions = [rev for rev, _ in self._get_revisions(req.id)]
+
+                if not resp.revisions:
+                    resp.error = "Program does not exist"
+                    return resp
+
+                resp.revision = req.revision if req.revision else resp.revisions[-1]
+
+                if resp.revision not in resp.revisions:
+                    resp.error = "Unknown revision"
+                    return resp
+
+                if resp.revision == resp.revisions[-1]:
+                    prog = self._get_program(req.id)
+                else:
+                    prog = self._load_program(req.id, resp.revision)
+
+            except StorageError as e:
+                resp.error = str(e)
+                return resp
+
+            if prog is None:
+                resp.error = "Failed to build program"
+                return resp
+
+            resp.program = prog
+            resp.success = True
+            return resp
+
+    def srv_get_programs_cb(self, req):
+
+        with self.lock_stats.locked("programs/get", self.program_locks.read(*req.ids)):
+
+            resp = getProgramsResponse()
+            resp.success = False
+
+            programs = {}
+            missing = []
+
+            for program_id in req.ids:
+
+                prog = self.programs.get(program_id)
+
+                if prog is None:
+                    missing.append(program_id)
+                else:
+                    programs[program_id] = prog
+
+            try:
+                # all programs not in the cache are fetched at once
+                if missing:
+
+                    deltas = {}
+
+                    for delta in self.db.query(ProgramDelta, keys=set(missing)):
+                        deltas.setdefault(delta.program_id, []).append(delta)
+
+                    for program_id, program_deltas in deltas.iteritems():
+
+                        program_deltas.sort(key=lambda d: d.revision)
+                        self.revisions[program_id] = [(d.revision, d.full) for d in program_deltas]
+                        prog = build_program(program_deltas)
+
+                        if prog is not None:
+                            self.programs.put(program_id, prog)
+                            programs[program_id] = prog
+
+                    # programs stored before revisions were introduced
+                    for program_id in set(missing) - set(deltas.keys()):
+
+                        prog = self._get_program(program_id)
+
+                        if prog is not None:
+                            programs[program_id] = prog
+            except StorageError as e:
+                resp.error = str(e)
+                return resp
+
+            for program_id in req.ids:
+
+                if program_id in programs:
+                    resp.programs.append(programs[program_id])
+                else:
+                    resp.unknown.append(program_id)
+
+            resp.success = not resp.unknown
+            return resp
+
+    def _get_program(self, program_id):
+        """Returns program from the cache or from the DB (None if it does not exist). Caller has to hold lock of
+        the program."""
+
+        prog = self.programs.get(program_id)
+
+        if prog is None:
+
+            prog = self._load_program(program_id)
+
+            if prog is not None:
+                self.programs.put(program_id, prog)
+
+        return prog
+
+    def srv_get_object_cb(self, req):
+
+        resp = getObjectTypeResponse()
+        resp.success = False
+
+        object_type = self.object_types.get(req.name)
+
+        if object_type is None:
+
+            with self.lock_stats.locked("object_type/get", [self.object_types_lock.read()]):
+
+                try:
+                    object_type = self.db.get(ObjectType, "object_type:" + str(req.name))
+                except StorageError as e:
+                    print "Service call failed: " + str(e)
+                    return resp
+
+                if object_type:
+                    self.object_types.put(req.name, object_type)
+
+        if object_type:
+
+            resp.success = True
+            resp.object_type = object_type
+            return resp
+
+        rospy.logerr("Unknown object type: " + req.name)
+        return resp
+
+    def srv_get_objects_cb(self, req):
+
+        resp = getObjectTypesResponse()
+        resp.success = False
+
+        object_types = {}
+        missing = []
+
+        for name in req.names:
+
+            object_type = self.object_types.get(name)
+
+            if object_type is None:
+                missing.append(name)
+            else:
+                object_types[name] = object_type
+
+        if missing:
+
+            with self.lock_stats.locked("object_types/get", [self.object_types_lock.read()]):
+
+                try:
+                    for object_type in self.db.query(ObjectType, keys=set(missing)):
+                        self.object_types.put(object_type.name, object_type)
+                        object_types[object_type.name] = object_type
+                except StorageError as e:
+                    resp.error = str(e)
+                    return resp
+
+        for name in req.names:
+
+            if name in object_types:
+                resp.object_types.append(object_types[name])
+            else:
+                resp.unknown.append(name)
+
+        if resp.unknown:
+            rospy.logerr("Unknown object types: " + ", ".join(resp.unknown))
+
+        resp.success = not resp.unknown
+        return resp
+
+    def srv_store_objects_cb(self, req):
+
+        with self.lock_stats.locked("object_types/store", [self.object_types_lock.write()]):
+
+            resp = storeObjectTypesResponse()
+            resp.success = False
+
+            for object_type in req.object_types:
+
+                try:
+                    stored = self.db.put("object_type:" + str(object_type.name), object_type)
+                except StorageError as e:
+                    resp.error = str(e)
+                    return resp
+
+                if not stored:
+                    resp.error = "Failed to store object type " + object_type.name
+                    return resp
+
+                self.object_types.put(object_type.name, object_type)
+                self._notify(DbChange.OBJECT_TYPE, DbChange.STORED, object_type.name)
+
+            resp.success = True
+            return resp
+
+    def srv_store_object_cb(self, req):
+
+        with self.lock_stats.locked("object_type/store", [self.object_types_lock.write()]):
+
+            resp = storeObjectTypeResponse()
+            name = "object_type:" + str(req.object_type.name)
+
+            try:
+                resp.success = self.db.put(name, req.object_type)
+            except StorageError as e:
+                print "Service call failed: " + str(e)
+                resp.success = False
+                return resp
+
+            if resp.success:
+                self.object_types.put(req.object_type.name, req.object_type)
+                self._notify(DbChange.OBJECT_TYPE, DbChange.STORED, req.object_type.name)
+
+            return resp
+
+
+def main(args):
+
+    rospy.init_node('art_db')
+    ArtDB()
+    rospy.spin()
+
+
+if __name__ == '__main__':
+    try:
+        main(sys.argv)
+    except KeyboardInterrupt:
+        print("Shutting down")
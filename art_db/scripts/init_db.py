@@ -3,39 +3,38 @@
 import sys
 import rospy
 from art_msgs.msg import Program, ProgramBlock, ProgramItem, ObjectType
-from art_msgs.srv import storeProgram, getObjectType, storeObjectType
+from art_db import ArtDbClient
 from shape_msgs.msg import SolidPrimitive
 from geometry_msgs.msg import PoseStamped, PolygonStamped, Point32
 from copy import deepcopy
 from art_msgs.msg import KeyValue
 
 
-def store_object_type(ot):
+# everything is stored at once (see flush)
+object_types = []
+programs = []
 
-    rospy.wait_for_service('/art/db/object_type/store')
 
-    try:
-        store_object_srv = rospy.ServiceProxy(
-            '/art/db/object_type/store', storeObjectType)
-        resp = store_object_srv(ot)
-    except rospy.ServiceException as e:
-        print "Service call failed: " + str(e)
-        return
+def store_object_type(ot):
+
+    object_types.append(deepcopy(ot))
 
 
 def store_program(prog):
 
-    rospy.wait_for_service('/art/db/program/store')
+    programs.append(deepcopy(prog))
 
-    try:
-        store_program_srv = rospy.ServiceProxy(
-            '/art/db/program/store', storeProgram)
-        resp = store_program_srv(program=prog)
-        if not resp.success:
-            print "Failed to save program ID: " + str(prog.header.id) + ", error: " + resp.error
-    except rospy.ServiceException as e:
-        print "Service call failed: " + str(e)
-        return
+
+def flush():
+
+    db = ArtDbClient()
+    db.wait_for_db()
+
+    if db.store_object_types(object_types):
+        print "Stored " + str(len(object_types)) + " object types."
+
+    if db.store_programs(programs):
+        print "Stored " + str(len(programs)) + " programs."
 
 
 def main(args):
@@ -493,6 +492,8 @@ def main(args):
 
     store_object_type(ot)
 
+    flush()
+
 
 if __name__ == '__main__':
     try:
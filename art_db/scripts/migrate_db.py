@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+
+"""
+Copies content of the Mongo DB (mongodb_store must be running) into SQLite file, which can be then used
+by art_db (art_db_sqlite.launch). Usage:
+
+    rosrun art_db migrate_db.py [path/to/art_db.sqlite]
+"""
+
+import sys
+import rospy
+import rospkg
+from art_msgs.msg import Program, ProgramHeader, ObjectType, CollisionPrimitive
+from art_db import MongoStorage, SqliteStorage, StorageError
+from art_db.msg import ProgramDelta
+
+
+def migrate(src, dst):
+
+    for msg_class in (ObjectType, CollisionPrimitive, Program, ProgramHeader, ProgramDelta):
+
+        items = src.items(msg_class)
+
+        for name, msg in items:
+            dst.put(name, msg)
+
+        print(msg_class._type + ": " + str(len(items)))
+
+
+def main(args):
+
+    rospy.init_node('art_db_migrate', anonymous=True)
+
+    path = args[1] if len(args) > 1 else rospkg.RosPack().get_path('art_db') + '/db/art_db.sqlite'
+
+    try:
+        migrate(MongoStorage(), SqliteStorage(path))
+    except StorageError as e:
+        print("Migration failed: " + str(e))
+        return
+
+    print("Migrated to " + path)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -6,6 +6,7 @@ from art_msgs.msg import ProgramItem, ProgramHeader, ProgramBlock, Program
 from art_msgs.srv import getProgram, getProgramRequest, getProgramResponse, getProgramHeaders, \
     getProgramHeadersRequest, getProgramHeadersResponse
 from art_utils import ArtApiHelper
+from art_db import ArtDbClient
 import rosbag
 import json
 
@@ -14,15 +15,17 @@ class ProgramStore(object):
 
     def __init__(self):
         self.art = ArtApiHelper()
+        self.db = ArtDbClient()
 
     def store_programs(self):
         program_headers = self.art.get_program_headers()
-        programs = []
+        programs = self.db.get_programs([h.id for h in program_headers])
+        if programs is None:
+            return
         file = open("JSONprograms_" + str(rospy.Time.now().to_nsec()), "w")
         bag = rosbag.Bag('BAGprograms_' + str(rospy.Time.now().to_nsec()) + '.bag', 'w')
         for header in program_headers:
-            program = self.art.load_program(header.id)
-            programs.append(program)
+            program = programs[header.id]
             to_print = json.loads(json_message_converter.convert_ros_message_to_json(program))
             file.write(">>>>>>>>>>>>>>>>>>>>>>>>>>    program id " + str(header.id) +
                        "   <<<<<<<<<<<<<<<<<<<<<<<<<<<<<\n")
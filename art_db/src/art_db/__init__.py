@@ -0,0 +1,6 @@
+from art_db.cache import LRUCache
+from art_db.client import ArtDbClient
+from art_db.storage import Storage, StorageError, MongoStorage, SqliteStorage, create_storage
+from art_db.locks import RWLock, KeyedRWLock, LockWaitStats
+from art_db.program_revisions import program_delta, apply_delta, build_program
+from art_db.metrics import ServiceMetrics, TimedStorage
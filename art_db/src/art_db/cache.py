@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """Dictionary-like cache with hit/miss counters, optionally bounded (least recently used entries are evicted).
+
+    All operations are atomic (guarded by internal lock), so the cache can be read while it is being updated.
+    """
+
+    def __init__(self, capacity=None):
+        """
+        Args:
+            capacity (int): Maximal number of entries, None for unbounded cache.
+        """
+
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns cached value or None (cache miss)."""
+
+        with self._lock:
+
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._data[key] = value  # most recently used entry is the last one
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+
+        with self._lock:
+
+            self._data.pop(key, None)
+            self._data[key] = value
+
+            if self.capacity is not None:
+
+                while len(self._data) > self.capacity:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+
+    def pop(self, key):
+
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def clear(self):
+
+        with self._lock:
+            self._data.clear()
+
+    def keys(self):
+
+        with self._lock:
+            return self._data.keys()
+
+    def values(self):
+
+        with self._lock:
+            return self._data.values()
+
+    def __contains__(self, key):
+
+        return key in self._data
+
+    def __len__(self):
+
+        return len(self._data)
+
+    def stats(self):
+
+        with self._lock:
+            return {"size": len(self._data), "capacity": self.capacity, "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions}
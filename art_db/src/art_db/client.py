@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+import rospy
+from art_db.srv import getObjectTypes, getPrograms, storeObjectTypes, storePrograms, getProgramRevision
+
+
+class ArtDbClient(object):
+    """Batch access to art_db - many object types or programs are transferred within one service call.
+
+    Methods return None (get) or False (store) on failure, in the same way as ArtApiHelper does.
+    """
+
+    def __init__(self):
+
+        self.get_object_types_srv = rospy.ServiceProxy('/art/db/object_types/get', getObjectTypes)
+        self.store_object_types_srv = rospy.ServiceProxy('/art/db/object_types/store', storeObjectTypes)
+        self.get_programs_srv = rospy.ServiceProxy('/art/db/programs/get', getPrograms)
+        self.store_programs_srv = rospy.ServiceProxy('/art/db/programs/store', storePrograms)
+        self.get_program_revision_srv = rospy.ServiceProxy('/art/db/program/revision/get', getProgramRevision)
+
+    def wait_for_db(self, timeout=None):
+
+        for srv in (self.get_object_types_srv, self.store_object_types_srv, self.get_programs_srv,
+                    self.store_programs_srv, self.get_program_revision_srv):
+            srv.wait_for_service(timeout)
+
+    def get_object_types(self, names):
+        """Returns dictionary (name -> ObjectType) of known object types."""
+
+        try:
+            resp = self.get_object_types_srv(names=list(names))
+        except rospy.ServiceException as e:
+            rospy.logerr("Service call failed: " + str(e))
+            return None
+
+        if resp.error:
+            rospy.logerr(resp.error)
+            return None
+
+        return {ot.name: ot for ot in resp.object_types}
+
+    def store_object_types(self, object_types):
+
+        try:
+            resp = self.store_object_types_srv(object_types=list(object_types))
+        except rospy.ServiceException as e:
+            rospy.logerr("Service call failed: " + str(e))
+            return False
+
+        if not resp.success:
+            rospy.logerr("Failed to store object types: " + resp.error)
+
+        return resp.success
+
+    def get_programs(self, ids):
+        """Returns dictionary (id -> Program) of existing programs."""
+
+        try:
+            resp = self.get_programs_srv(ids=list(ids))
+        except rospy.ServiceException as e:
+            rospy.logerr("Service call failed: " + str(e))
+            return None
+
+        if resp.error:
+            rospy.logerr(resp.error)
+            return None
+
+        return {prog.header.id: prog for prog in resp.programs}
+
+    def store_programs(self, programs):
+        """Stores all programs, or none of them (if any is invalid or readonly)."""
+
+        try:
+            resp = self.store_programs_srv(programs=list(programs))
+        except rospy.ServiceException as e:
+            rospy.logerr("Service call failed: " + str(e))
+            return False
+
+        if not resp.success:
+            rospy.logerr("Failed to store programs: " + resp.error)
+
+        return resp.success
+
+    def get_program_revision(self, program_id, revision=0):
+        """Returns (program, revision, all revisions) tuple, revision 0 means the latest one."""
+
+        try:
+            resp = self.get_program_revision_srv(id=program_id, revision=revision)
+        except rospy.ServiceException as e:
+            rospy.logerr("Service call failed: " + str(e))
+            return None
+
+        if not resp.success:
+            rospy.logerr("Failed to get program revision: " + resp.error)
+            return None
+
+        return resp.program, resp.revision, list(resp.revisions)
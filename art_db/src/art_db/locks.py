@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class _Guard(object):
+
+    def __init__(self, acquire, release):
+
+        self.acquire = acquire
+        self.release = release
+
+    def __enter__(self):
+
+        self.acquire()
+
+    def __exit__(self, *args):
+
+        self.release()
+
+
+class RWLock(object):
+    """Readers-writer lock - any number of readers or one writer. Waiting writers block new readers."""
+
+    def __init__(self):
+
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self):
+
+        with self._cond:
+
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+
+            self._readers += 1
+
+    def release_read(self):
+
+        with self._cond:
+
+            self._readers -= 1
+
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+
+        with self._cond:
+
+            self._writers_waiting += 1
+
+            while self._writer or self._readers:
+                self._cond.wait()
+
+            self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self):
+
+        with self._cond:
+
+            self._writer = False
+            self._cond.notify_all()
+
+    def read(self):
+
+        return _Guard(self.acquire_read, self.release_read)
+
+    def write(self):
+
+        return _Guard(self.acquire_write, self.release_write)
+
+
+class KeyedRWLock(object):
+    """RWLock for each key (e.g. program id), created on demand.
+
+    Locks for more keys are always acquired in sorted order, so they can't deadlock.
+    """
+
+    def __init__(self):
+
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+
+        with self._lock:
+            return self._locks.setdefault(key, RWLock())
+
+    def read(self, *keys):
+
+        return [self._get(key).read() for key in sorted(set(keys))]
+
+    def write(self, *keys):
+
+        return [self._get(key).write() for key in sorted(set(keys))]
+
+
+class LockWaitStats(object):
+    """Acquires locks and records how long it took, per service."""
+
+    def __init__(self, wait_cb=None):
+        """
+        Args:
+            wait_cb (callable): Optionally called with each recorded wait time (e.g. ServiceMetrics lock phase).
+        """
+
+        self._lock = threading.Lock()
+        self._waits = {}  # service -> [count, total, max]
+        self._wait_cb = wait_cb
+
+    @contextmanager
+    def locked(self, service, guards):
+        """Context manager holding all given locks (guards from read/write methods).
+
+        Args:
+            service (str): Name under which the wait time is recorded.
+            guards (list): Acquired in given order, released in reverse order.
+        """
+
+        start = time.time()
+        acquired = []
+
+        try:
+
+            for guard in guards:
+                guard.acquire()
+                acquired.append(guard)
+
+            self.add(service, time.time() - start)
+            yield
+
+        finally:
+
+            for guard in reversed(acquired):
+                guard.release()
+
+    def add(self, service, wait):
+
+        with self._lock:
+
+            st = self._waits.setdefault(service, [0, 0.0, 0.0])
+            st[0] += 1
+            st[1] += wait
+            st[2] = max(st[2], wait)
+
+        if self._wait_cb is not None:
+            self._wait_cb(wait)
+
+    def report(self):
+
+        with self._lock:
+
+            return ", ".join("%s: n=%d avg=%.3fms max=%.3fms" % (service, st[0], st[1] / st[0] * 1e3, st[2] * 1e3)
+                             for service, st in sorted(self._waits.items()))
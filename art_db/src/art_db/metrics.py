@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+
+import threading
+import time
+from io import BytesIO
+from contextlib import contextmanager
+import rospy
+from diagnostic_msgs.msg import DiagnosticArray, DiagnosticStatus, KeyValue
+
+
+def _msg_size(msg):
+
+    if msg is None:
+        return 0
+
+    buff = BytesIO()
+    msg.serialize(buff)
+    return len(buff.getvalue())
+
+
+class _Histogram(object):
+
+    BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)  # upper bounds in seconds
+
+    def __init__(self):
+
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, val):
+
+        idx = 0
+
+        while idx < len(self.BUCKETS) and val > self.BUCKETS[idx]:
+            idx += 1
+
+        self.counts[idx] += 1
+        self.total += val
+        self.max = max(self.max, val)
+
+    def __str__(self):
+
+        bounds = ["<=%gms" % (b * 1e3) for b in self.BUCKETS] + [">%gms" % (self.BUCKETS[-1] * 1e3)]
+        return " ".join(b + ":" + str(c) for b, c in zip(bounds, self.counts) if c)
+
+
+class _ServiceStats(object):
+
+    def __init__(self):
+
+        self.count = 0
+        self.latency = {phase: _Histogram() for phase in ServiceMetrics.PHASES}
+        self.request_bytes = _Histogram()
+        self.response_bytes = _Histogram()
+        self.callers = {}  # node -> number of calls
+
+
+class ServiceMetrics(object):
+    """Records per-service call counts, latency histograms (total time and time spent in lock waiting, storage and
+    validation), payload sizes and callers. Calls slower than threshold are logged together with their request.
+
+    Time of phases is accumulated per thread, while a call wrapped by wrap() is being handled.
+    """
+
+    PHASES = ("total", "lock", "storage", "validation")
+
+    def __init__(self, slow_threshold=None):
+        """
+        Args:
+            slow_threshold (float): Calls taking longer (seconds) are logged, None to disable.
+        """
+
+        self.slow_threshold = slow_threshold
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._services = {}  # service name -> _ServiceStats
+
+    def wrap(self, service, handler):
+        """Returns service handler recording metrics of given handler."""
+
+        def wrapped(req):
+
+            phases = dict.fromkeys(self.PHASES, 0.0)
+            self._local.phases = phases
+            resp = None
+
+            start = time.time()
+
+            try:
+                resp = handler(req)
+                return resp
+            finally:
+
+                phases["total"] = time.time() - start
+                self._local.phases = None
+                self._record(service, req, resp, phases)
+
+        return wrapped
+
+    def add(self, phase, seconds):
+        """Adds time to given phase of the call being handled by the current thread (if any)."""
+
+        phases = getattr(self._local, "phases", None)
+
+        if phases is not None:
+            phases[phase] += seconds
+
+    @contextmanager
+    def phase(self, phase):
+
+        start = time.time()
+
+        try:
+            yield
+        finally:
+            self.add(phase, time.time() - start)
+
+    def _record(self, service, req, resp, phases):
+
+        caller = getattr(req, "_connection_header", {}).get("callerid", "unknown")
+        req_size = _msg_size(req)
+        resp_size = _msg_size(resp)
+
+        with self._lock:
+
+            st = self._services.setdefault(service, _ServiceStats())
+            st.count += 1
+            st.callers[caller] = st.callers.get(caller, 0) + 1
+            st.request_bytes.add(req_size)
+            st.response_bytes.add(resp_size)
+
+            for phase, val in phases.iteritems():
+                st.latency[phase].add(val)
+
+        if self.slow_threshold is not None and phases["total"] > self.slow_threshold:
+
+            rospy.logwarn("Slow call of " + service + " by " + caller + " (" +
+                          ", ".join("%s: %.1fms" % (p, phases[p] * 1e3) for p in self.PHASES) + "), request: " +
+                          str(req).replace("\n", " ")[:1000])
+
+    def diagnostics(self):
+        """Returns current metrics as DiagnosticArray (one status per service)."""
+
+        arr = DiagnosticArray()
+        arr.header.stamp = rospy.Time.now()
+
+        with self._lock:
+
+            for service, st in sorted(self._services.items()):
+
+                status = DiagnosticStatus(level=DiagnosticStatus.OK, name="art_db: " + service,
+                                          message=str(st.count) + " calls")
+
+                status.values.append(KeyValue("calls", str(st.count)))
+
+                for phase in self.PHASES:
+
+                    hist = st.latency[phase]
+                    status.values.append(KeyValue(phase + " avg [ms]", "%.3f" % (hist.total / st.count * 1e3)))
+                    status.values.append(KeyValue(phase + " max [ms]", "%.3f" % (hist.max * 1e3)))
+                    status.values.append(KeyValue(phase + " histogram", str(hist)))
+
+                for name, hist in (("request", st.request_bytes), ("response", st.response_bytes)):
+
+                    status.values.append(KeyValue(name + " avg [B]", str(int(hist.total / st.count))))
+                    status.values.append(KeyValue(name + " max [B]", str(int(hist.max))))
+
+                status.values.append(KeyValue("callers", " ".join(
+                    caller + ":" + str(cnt) for caller, cnt in sorted(st.callers.items(), key=lambda x: -x[1]))))
+
+                arr.status.append(status)
+
+        return arr
+
+
+class TimedStorage(object):
+    """Storage proxy adding time of all storage calls to "storage" phase of ServiceMetrics."""
+
+    def __init__(self, storage, metrics):
+
+        self._storage = storage
+        self._metrics = metrics
+
+    def __getattr__(self, name):
+
+        attr = getattr(self._storage, name)
+
+        if not callable(attr):
+            return attr
+
+        def timed(*args, **kwargs):
+
+            with self._metrics.phase("storage"):
+                return attr(*args, **kwargs)
+
+        return timed
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+
+from copy import deepcopy
+from io import BytesIO
+from art_msgs.msg import Program, ProgramItem
+from art_db.msg import ProgramDelta
+
+
+def _same(a, b):
+    """Messages are compared in serialized form (it does not depend on __eq__ / __ne__ of generated classes)."""
+
+    if a is None or b is None:
+        return a is b
+
+    buffs = BytesIO(), BytesIO()
+    a.serialize(buffs[0])
+    b.serialize(buffs[1])
+    return buffs[0].getvalue() == buffs[1].getvalue()
+
+
+def _block_attrs(block):
+    """Copy of the block without items (for comparison of block attributes)."""
+
+    # block is not modified - it might be e.g. just being sent by another thread
+    attrs = type(block)()
+
+    for slot in block.__slots__:
+        if slot != "items":
+            setattr(attrs, slot, deepcopy(getattr(block, slot)))
+
+    return attrs
+
+
+def _skeleton(block):
+    """Copy of the block, its items contain only ids."""
+
+    sk = _block_attrs(block)
+    sk.items = [ProgramItem(id=it.id) for it in block.items]
+    return sk
+
+
+def program_delta(old, new):
+    """Returns ProgramDelta which turns old program into new one (complete program if old is None).
+
+    Only new or changed blocks and items are included, so the delta of typical edit (e.g. learning of one
+    item) is small.
+    """
+
+    delta = ProgramDelta()
+    delta.program_id = new.header.id
+    delta.full = old is None
+    delta.header = deepcopy(new.header)
+
+    old_blocks = {} if old is None else {b.id: b for b in old.blocks}
+
+    for block in new.blocks:
+
+        delta.block_ids.append(block.id)
+
+        old_block = old_blocks.get(block.id)
+        old_items = {} if old_block is None else {it.id: it for it in old_block.items}
+
+        if old_block is None or not _same(_block_attrs(old_block), _block_attrs(block)) or \
+                [it.id for it in old_block.items] != [it.id for it in block.items]:
+            delta.blocks.append(_skeleton(block))
+
+        for it in block.items:
+
+            if not _same(old_items.get(it.id), it):
+
+                delta.item_block_ids.append(block.id)
+                delta.items.append(deepcopy(it))
+
+    return delta
+
+
+def apply_delta(prog, delta):
+    """Returns new program - given one (None for full delta) with the delta applied. Program is not modified."""
+
+    old_blocks = {} if delta.full or prog is None else {b.id: b for b in prog.blocks}
+    changed_blocks = {b.id: b for b in delta.blocks}
+    changed_items = {(block_id, it.id): it for block_id, it in zip(delta.item_block_ids, delta.items)}
+
+    new = Program()
+    new.header = deepcopy(delta.header)
+
+    for block_id in delta.block_ids:
+
+        old_block = old_blocks.get(block_id)
+        old_items = {} if old_block is None else {it.id: it for it in old_block.items}
+
+        block = changed_blocks.get(block_id, old_block)
+        new_block = _block_attrs(block)
+
+        for it in block.items:
+
+            item = changed_items.get((block_id, it.id), old_items.get(it.id))
+            new_block.items.append(deepcopy(item))
+
+        new.blocks.append(new_block)
+
+    return new
+
+
+def build_program(deltas, revision=None):
+    """Applies deltas (sorted by revision) up to given revision (the latest if None), starting from the last full
+    one. Returns None if there is no full delta to start from."""
+
+    if revision is not None:
+        deltas = [d for d in deltas if d.revision <= revision]
+
+    start = None
+
+    for idx, delta in enumerate(deltas):
+        if delta.full:
+            start = idx
+
+    if start is None:
+        return None
+
+    prog = None
+
+    for delta in deltas[start:]:
+        prog = apply_delta(prog, delta)
+
+    return prog
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+
+import os
+import sqlite3
+import threading
+from io import BytesIO
+
+# messages are looked up by this field (if not listed, "name" is used)
+KEY_FIELDS = {"art_msgs/Program": "header.id", "art_msgs/ProgramHeader": "id", "art_db/ProgramDelta": "program_id"}
+
+
+class StorageError(Exception):
+    pass
+
+
+def key_field(msg_class):
+
+    return KEY_FIELDS.get(msg_class._type, "name")
+
+
+def message_key(msg):
+
+    val = msg
+
+    for attr in key_field(msg).split("."):
+        val = getattr(val, attr)
+
+    return val
+
+
+class Storage(object):
+    """Persistent storage of named ROS messages.
+
+    Each message is stored under unique name (within its type). Messages can be also queried by their key
+    (see KEY_FIELDS) and setup (only messages having the setup attribute, e.g. CollisionPrimitive).
+    All methods raise StorageError on failure.
+    """
+
+    def get(self, msg_class, name):
+        """Returns message stored under given name (or None)."""
+
+        raise NotImplementedError()
+
+    def query(self, msg_class, keys=None, setup=None):
+        """Returns list of messages of given type, optionally only those with given keys and/or setup."""
+
+        raise NotImplementedError()
+
+    def items(self, msg_class):
+        """Returns list of (name, message) tuples of all stored messages of given type."""
+
+        raise NotImplementedError()
+
+    def put(self, name, msg):
+        """Stores (inserts or replaces) message under given name. Returns True on success."""
+
+        raise NotImplementedError()
+
+    def delete(self, msg_class, name):
+        """Deletes message stored under given name. Returns False if there is no such message."""
+
+        raise NotImplementedError()
+
+    def delete_query(self, msg_class, keys=None, setup=None):
+        """Deletes all messages matching given keys and/or setup (see query), returns list of deleted messages."""
+
+        raise NotImplementedError()
+
+
+class MongoStorage(Storage):
+    """Storage based on mongodb_store (each call is a service call to the message_store node)."""
+
+    def __init__(self):
+
+        import rospy
+        from mongodb_store.message_store import MessageStoreProxy
+
+        self.exception = rospy.ServiceException
+        self.db = MessageStoreProxy()
+
+    def get(self, msg_class, name):
+
+        try:
+            return self.db.query_named(name, msg_class._type)[0]
+        except self.exception as e:
+            raise StorageError(str(e))
+
+    @staticmethod
+    def _message_query(msg_class, keys, setup):
+
+        message_query = {}
+
+        if keys is not None:
+            message_query[key_field(msg_class)] = {"$in": list(keys)}
+
+        if setup is not None:
+            message_query["setup"] = setup
+
+        return message_query
+
+    def query(self, msg_class, keys=None, setup=None):
+
+        try:
+            return [msg for msg, _ in self.db.query(msg_class._type,
+                                                    message_query=self._message_query(msg_class, keys, setup))]
+        except self.exception as e:
+            raise StorageError(str(e))
+
+    def items(self, msg_class):
+
+        try:
+            return [(meta["name"], msg) for msg, meta in self.db.query(msg_class._type) if "name" in meta]
+        except self.exception as e:
+            raise StorageError(str(e))
+
+    def put(self, name, msg):
+
+        try:
+            return self.db.update_named(name, msg, upsert=True).success
+        except self.exception as e:
+            raise StorageError(str(e))
+
+    def delete(self, msg_class, name):
+
+        try:
+
+            meta = self.db.query_named(name, msg_class._type)[1]
+
+            if meta is None:
+                return False
+
+            return self.db.delete(str(meta["_id"]))
+
+        except self.exception as e:
+            raise StorageError(str(e))
+
+    def delete_query(self, msg_class, keys=None, setup=None):
+
+        # message_store can't delete more documents at once - at least they are found by one query
+        try:
+
+            deleted = []
+
+            for msg, meta in self.db.query(msg_class._type,
+                                           message_query=self._message_query(msg_class, keys, setup)):
+                if self.db.delete(str(meta["_id"])):
+                    deleted.append(msg)
+
+            return deleted
+
+        except self.exception as e:
+            raise StorageError(str(e))
+
+
+class SqliteStorage(Storage):
+    """Storage in local SQLite file - serialized messages with indexed type, name, key and setup columns.
+
+    There is no other process involved, so lookups are much faster than with MongoStorage.
+    """
+
+    # SQLite limits number of variables in one statement
+    MAX_VARIABLES = 500
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Database file (created if it does not exist), ":memory:" for in-memory database.
+        """
+
+        self.lock = threading.Lock()
+
+        try:
+
+            if path != ":memory:" and os.path.dirname(path) and not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+
+            with self.conn:
+                self.conn.execute("CREATE TABLE IF NOT EXISTS messages (type TEXT NOT NULL, name TEXT NOT NULL, "
+                                  "key TEXT, setup TEXT, data BLOB NOT NULL, PRIMARY KEY (type, name))")
+                self.conn.execute("CREATE INDEX IF NOT EXISTS messages_key ON messages (type, key)")
+                self.conn.execute("CREATE INDEX IF NOT EXISTS messages_setup ON messages (type, setup)")
+
+        except (sqlite3.Error, OSError) as e:
+            raise StorageError(str(e))
+
+    def _select(self, msg_class, where="", args=()):
+
+        try:
+            with self.lock:
+                rows = self.conn.execute("SELECT name, data FROM messages WHERE type = ?" + where,
+                                         (msg_class._type,) + tuple(args)).fetchall()
+        except sqlite3.Error as e:
+            raise StorageError(str(e))
+
+        return [(name, msg_class().deserialize(str(data))) for name, data in rows]
+
+    def get(self, msg_class, name):
+
+        rows = self._select(msg_class, " AND name = ?", (name, ))
+        return rows[0][1] if rows else None
+
+    def _filters(self, keys, setup):
+        """Yields (where, args) tuples - more of them if there are too many keys for one statement."""
+
+        where = ""
+        args = ()
+
+        if setup is not None:
+            where += " AND setup = ?"
+            args += (setup, )
+
+        if keys is None:
+            yield where, args
+            return
+
+        keys = [str(k) for k in keys]
+
+        for i in range(0, len(keys), self.MAX_VARIABLES):
+
+            chunk = keys[i:i + self.MAX_VARIABLES]
+            yield where + " AND key IN (" + ",".join("?" * len(chunk)) + ")", args + tuple(chunk)
+
+    def query(self, msg_class, keys=None, setup=None):
+
+        ret = []
+
+        for where, args in self._filters(keys, setup):
+            ret.extend(msg for _, msg in self._select(msg_class, where, args))
+
+        return ret
+
+    def items(self, msg_class):
+
+        return self._select(msg_class)
+
+    def put(self, name, msg):
+
+        buff = BytesIO()
+        msg.serialize(buff)
+
+        try:
+            with self.lock, self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO messages (type, name, key, setup, data) "
+                                  "VALUES (?, ?, ?, ?, ?)", (msg._type, name, str(message_key(msg)),
+                                                             getattr(msg, "setup", None),
+                                                             sqlite3.Binary(buff.getvalue())))
+        except sqlite3.Error as e:
+            raise StorageError(str(e))
+
+        return True
+
+    def delete(self, msg_class, name):
+
+        try:
+            with self.lock, self.conn:
+                cur = self.conn.execute("DELETE FROM messages WHERE type = ? AND name = ?", (msg_class._type, name))
+        except sqlite3.Error as e:
+            raise StorageError(str(e))
+
+        return cur.rowcount > 0
+
+    def delete_query(self, msg_class, keys=None, setup=None):
+
+        rows = []
+
+        for where, args in self._filters(keys, setup):
+
+            args = (msg_class._type, ) + args
+
+            try:
+                with self.lock, self.conn:
+                    rows.extend(self.conn.execute("SELECT data FROM messages WHERE type = ?" + where, args).fetchall())
+                    self.conn.execute("DELETE FROM messages WHERE type = ?" + where, args)
+            except sqlite3.Error as e:
+                raise StorageError(str(e))
+
+        return [msg_class().deserialize(str(data)) for data, in rows]
+
+
+def create_storage(backend, sqlite_path=None):
+    """Creates storage by its name ("mongo" or "sqlite")."""
+
+    if backend == "mongo":
+        return MongoStorage()
+
+    if backend == "sqlite":
+        return SqliteStorage(sqlite_path)
+
+    raise ValueError("Unknown storage backend: " + str(backend))
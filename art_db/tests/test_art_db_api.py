@@ -8,6 +8,7 @@ from copy import deepcopy
 
 from art_msgs.msg import Program, ProgramBlock, ProgramItem, ObjectType
 from art_msgs.srv import getProgram, getProgramHeaders, storeProgram, getObjectType, storeObjectType
+from art_db import ArtDbClient
 from shape_msgs.msg import SolidPrimitive
 from geometry_msgs.msg import PoseStamped, PolygonStamped, Point32
 
@@ -27,6 +28,9 @@ class TestArtDb(unittest.TestCase):
         self.get_program_srv = rospy.ServiceProxy('/art/db/program/get', getProgram)
         self.get_program_headers_srv = rospy.ServiceProxy('/art/db/program_headers/get', getProgramHeaders)
 
+        self.db = ArtDbClient()
+        self.db.wait_for_db()
+
     def test_object_type(self):
 
         ot = ObjectType()
@@ -220,6 +224,60 @@ class TestArtDb(unittest.TestCase):
 
         self.assertEquals(resp_store.success, False, "invalid_program_store")
 
+    def test_batch_object_types(self):
+
+        types = []
+
+        for name in ("batch_test_1", "batch_test_2"):
+
+            ot = ObjectType()
+            ot.name = name
+            ot.bbox.type = SolidPrimitive.BOX
+            ot.bbox.dimensions = [0.1, 0.1, 0.1]
+            types.append(ot)
+
+        self.assertEquals(self.db.store_object_types(types), True, "batch_object_types_store")
+
+        object_types = self.db.get_object_types(["batch_test_2", "batch_test_xy", "batch_test_1"])
+
+        self.assertEquals(set(object_types.keys()), set(["batch_test_1", "batch_test_2"]), "batch_object_types_get")
+
+    def test_batch_invalid_programs_store(self):
+
+        p = Program()
+        p.header.id = 1235
+
+        self.assertEquals(self.db.store_programs([p]), False, "batch_invalid_programs_store")
+        self.assertEquals(self.db.get_programs([1235]), {}, "batch_invalid_programs_store")
+
+    def test_program_revisions(self):
+
+        prog = Program()
+        prog.header.id = 997
+        prog.header.name = "Revisions"
+
+        pb = ProgramBlock()
+        pb.id = 1
+        pb.on_success = 1
+        pb.on_failure = 0
+        pb.items.append(ProgramItem(id=1, type="GetReady", on_success=0, on_failure=0))
+        prog.blocks.append(pb)
+
+        self.assertEquals(self.store_program_srv(program=prog).success, True, "program_revisions")
+
+        prog.header.name = "Revisions 2"
+        self.assertEquals(self.store_program_srv(program=prog).success, True, "program_revisions")
+
+        latest, revision, revisions = self.db.get_program_revision(997)
+
+        self.assertEquals(latest.header.name, "Revisions 2", "program_revisions")
+        self.assertEquals(revisions[-1], revision, "program_revisions")
+
+        first = self.db.get_program_revision(997, revisions[-2])[0]
+
+        self.assertEquals(first.header.name, "Revisions", "program_revisions")
+        self.assertEquals(first.blocks, latest.blocks, "program_revisions")
+
 
 if __name__ == '__main__':
 
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+import threading
+import unittest
+from art_db import RWLock, KeyedRWLock, LockWaitStats
+
+
+class TestLocks(unittest.TestCase):
+
+    def test_rw_lock(self):
+
+        lock = RWLock()
+        stats = LockWaitStats()
+        acquired = threading.Event()
+
+        def writer():
+
+            with stats.locked("write", [lock.write()]):
+                acquired.set()
+
+        with stats.locked("read", [lock.read()]):
+
+            # more readers at once
+            with stats.locked("read", [lock.read()]):
+                pass
+
+            th = threading.Thread(target=writer)
+            th.start()
+
+            self.assertEquals(acquired.wait(0.1), False, "test_rw_lock")
+
+        th.join(1.0)
+
+        self.assertEquals(acquired.is_set(), True, "test_rw_lock")
+        self.assertEquals(stats.report().startswith("read: n=2"), True, "test_rw_lock")
+
+    def test_keyed_rw_lock(self):
+
+        locks = KeyedRWLock()
+        stats = LockWaitStats()
+
+        # locks of different keys are independent
+        with stats.locked("write", locks.write(1)):
+            with stats.locked("write", locks.write(3, 2, 2)):
+                with stats.locked("read", locks.read(4)):
+                    pass
+
+        self.assertEquals(len(locks.write(3, 2, 2)), 2, "test_keyed_rw_lock")
+
+
+if __name__ == '__main__':
+
+    import rosunit
+    rosunit.unitrun('art_db', 'test_locks', TestLocks)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+import time
+import unittest
+from std_srvs.srv import TriggerRequest, TriggerResponse
+from art_db import ServiceMetrics, TimedStorage, LockWaitStats, RWLock
+
+
+class FakeStorage(object):
+
+    def get(self, msg_class, name):
+
+        time.sleep(0.01)
+        return None
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_phases(self):
+
+        metrics = ServiceMetrics()
+        storage = TimedStorage(FakeStorage(), metrics)
+        stats = LockWaitStats(lambda wait: metrics.add("lock", wait))
+        lock = RWLock()
+
+        def handler(req):
+
+            with stats.locked("test", [lock.read()]):
+                storage.get(None, "name")
+
+            with metrics.phase("validation"):
+                time.sleep(0.01)
+
+            return TriggerResponse(success=True, message="x" * 100)
+
+        srv = metrics.wrap("test", handler)
+
+        for _ in range(3):
+            srv(TriggerRequest())
+
+        # calls outside of wrapped handler are not recorded
+        storage.get(None, "name")
+
+        status = metrics.diagnostics().status
+        self.assertEquals(len(status), 1, "test_phases")
+        self.assertEquals(status[0].name, "art_db: test", "test_phases")
+
+        values = {kv.key: kv.value for kv in status[0].values}
+        self.assertEquals(values["calls"], "3", "test_phases")
+        self.assertGreaterEqual(float(values["storage avg [ms]"]), 10.0, "test_phases")
+        self.assertGreaterEqual(float(values["validation avg [ms]"]), 10.0, "test_phases")
+        self.assertGreaterEqual(float(values["total avg [ms]"]), 20.0, "test_phases")
+        self.assertEquals(values["request max [B]"], "0", "test_phases")
+        self.assertGreater(int(values["response max [B]"]), 100, "test_phases")
+        self.assertEquals(values["callers"], "unknown:3", "test_phases")
+
+    def test_exception(self):
+
+        metrics = ServiceMetrics(slow_threshold=0.0)
+
+        def handler(req):
+            raise ValueError()
+
+        srv = metrics.wrap("test", handler)
+
+        self.assertRaises(ValueError, srv, TriggerRequest())
+        self.assertEquals(metrics.diagnostics().status[0].values[0].value, "1", "test_exception")
+
+
+if __name__ == '__main__':
+
+    import rosunit
+    rosunit.unitrun('art_db', 'test_metrics', TestMetrics)
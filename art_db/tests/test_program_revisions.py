@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+import unittest
+from copy import deepcopy
+from art_msgs.msg import Program, ProgramBlock, ProgramItem
+from art_db import program_delta, apply_delta, build_program
+
+
+def make_program():
+
+    prog = Program()
+    prog.header.id = 1
+    prog.header.name = "Test"
+
+    for block_id in (1, 2):
+
+        pb = ProgramBlock()
+        pb.id = block_id
+        pb.name = "Block " + str(block_id)
+        pb.on_success = block_id + 1 if block_id < 2 else 0
+
+        for item_id in (1, 2, 3):
+
+            p = ProgramItem()
+            p.id = item_id
+            p.type = "GetReady"
+            p.on_success = item_id + 1 if item_id < 3 else 0
+            pb.items.append(p)
+
+        prog.blocks.append(pb)
+
+    return prog
+
+
+class TestProgramRevisions(unittest.TestCase):
+
+    def test_full_delta(self):
+
+        prog = make_program()
+        delta = program_delta(None, prog)
+
+        self.assertEquals(delta.full, True, "test_full_delta")
+        self.assertEquals(len(delta.items), 6, "test_full_delta")
+        self.assertEquals(apply_delta(None, delta), prog, "test_full_delta")
+
+    def test_item_delta(self):
+
+        old = make_program()
+        new = deepcopy(old)
+        new.blocks[1].items[2].name = "changed"
+
+        delta = program_delta(old, new)
+
+        self.assertEquals(delta.full, False, "test_item_delta")
+        self.assertEquals(len(delta.blocks), 0, "test_item_delta")
+        self.assertEquals(delta.item_block_ids, [2], "test_item_delta")
+        self.assertEquals(apply_delta(old, delta), new, "test_item_delta")
+
+        self.assertEquals(len(program_delta(new, new).items), 0, "test_item_delta")
+
+    def test_structure_delta(self):
+
+        old = make_program()
+        new = deepcopy(old)
+        del new.blocks[0].items[1]
+        new.blocks[1].name = "renamed"
+
+        pb = ProgramBlock()
+        pb.id = 3
+        pb.items.append(ProgramItem(id=1, type="GetReady"))
+        new.blocks.append(pb)
+
+        delta = program_delta(old, new)
+
+        self.assertEquals(len(delta.blocks), 3, "test_structure_delta")
+        self.assertEquals(len(delta.items), 1, "test_structure_delta")
+        self.assertEquals(apply_delta(old, delta), new, "test_structure_delta")
+
+    def test_build_program(self):
+
+        revisions = [make_program()]
+
+        for i in range(3):
+
+            prog = deepcopy(revisions[-1])
+            prog.blocks[0].items[0].name = "revision " + str(i + 2)
+            revisions.append(prog)
+
+        deltas = []
+
+        for i, prog in enumerate(revisions):
+
+            delta = program_delta(revisions[i - 1] if i else None, prog)
+            delta.revision = i + 1
+            deltas.append(delta)
+
+        self.assertEquals(build_program(deltas), revisions[-1], "test_build_program")
+        self.assertEquals(build_program(deltas, 2), revisions[1], "test_build_program")
+        self.assertIsNone(build_program(deltas[1:]), "test_build_program")
+
+
+if __name__ == '__main__':
+
+    import rosunit
+    rosunit.unitrun('art_db', 'test_program_revisions', TestProgramRevisions)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+import unittest
+from art_msgs.msg import Program, ProgramHeader, ObjectType, CollisionPrimitive
+from shape_msgs.msg import SolidPrimitive
+from art_db import SqliteStorage
+
+
+class TestSqliteStorage(unittest.TestCase):
+
+    def setUp(self):
+
+        self.storage = SqliteStorage(":memory:")
+
+    def test_put_get(self):
+
+        ot = ObjectType()
+        ot.name = "type1"
+        ot.bbox.type = SolidPrimitive.BOX
+        ot.bbox.dimensions = [0.1, 0.2, 0.3]
+
+        self.assertEquals(self.storage.put("object_type:type1", ot), True, "test_put_get")
+
+        stored = self.storage.get(ObjectType, "object_type:type1")
+
+        self.assertEquals(stored.name, "type1", "test_put_get")
+        self.assertEquals(list(stored.bbox.dimensions), [0.1, 0.2, 0.3], "test_put_get")
+        self.assertIsNone(self.storage.get(ObjectType, "object_type:type2"), "test_put_get")
+        self.assertIsNone(self.storage.get(Program, "object_type:type1"), "test_put_get")
+
+        ot.bbox.dimensions = [0.1, 0.1, 0.1]
+        self.storage.put("object_type:type1", ot)
+
+        self.assertEquals(list(self.storage.get(ObjectType, "object_type:type1").bbox.dimensions), [0.1, 0.1, 0.1],
+                          "test_put_get")
+        self.assertEquals(len(self.storage.items(ObjectType)), 1, "test_put_get")
+
+    def test_query(self):
+
+        for i in range(1, 4):
+
+            prog = Program()
+            prog.header.id = i
+            self.storage.put("program:" + str(i), prog)
+            self.storage.put("program_header:" + str(i), prog.header)
+
+        self.assertEquals(len(self.storage.query(Program)), 3, "test_query")
+        self.assertEquals(sorted(p.header.id for p in self.storage.query(Program, keys=[1, 3, 5])), [1, 3],
+                          "test_query")
+        self.assertEquals([h.id for h in self.storage.query(ProgramHeader, keys=[2])], [2], "test_query")
+
+        for name, setup in (("box", "setup1"), ("box", "setup2"), ("table", "setup1")):
+
+            prim = CollisionPrimitive()
+            prim.name = name
+            prim.setup = setup
+            self.storage.put("collision_primitive_" + name + "_" + setup, prim)
+
+        self.assertEquals(sorted(p.name for p in self.storage.query(CollisionPrimitive, setup="setup1")),
+                          ["box", "table"], "test_query")
+        self.assertEquals(len(self.storage.query(CollisionPrimitive, keys=["box"], setup="setup2")), 1, "test_query")
+
+    def test_delete(self):
+
+        prog = Program()
+        prog.header.id = 1
+        self.storage.put("program:1", prog)
+
+        self.assertEquals(self.storage.delete(Program, "program:1"), True, "test_delete")
+        self.assertEquals(self.storage.delete(Program, "program:1"), False, "test_delete")
+        self.assertIsNone(self.storage.get(Program, "program:1"), "test_delete")
+
+    def test_delete_query(self):
+
+        for name, setup in (("box", "setup1"), ("box", "setup2"), ("table", "setup1"), ("chair", "setup1")):
+
+            prim = CollisionPrimitive()
+            prim.name = name
+            prim.setup = setup
+            self.storage.put("collision_primitive_" + name + "_" + setup, prim)
+
+        deleted = self.storage.delete_query(CollisionPrimitive, keys=["box", "chair", "lamp"], setup="setup1")
+
+        self.assertEquals(sorted(p.name for p in deleted), ["box", "chair"], "test_delete_query")
+        self.assertEquals(len(self.storage.query(CollisionPrimitive)), 2, "test_delete_query")
+
+        self.assertEquals(len(self.storage.delete_query(CollisionPrimitive, setup="setup2")), 1, "test_delete_query")
+        self.assertEquals([p.name for p in self.storage.query(CollisionPrimitive)], ["table"], "test_delete_query")
+
+
+if __name__ == '__main__':
+
+    import rosunit
+    rosunit.unitrun('art_db', 'test_storage', TestSqliteStorage)
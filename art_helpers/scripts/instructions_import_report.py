@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+"""
+Prints how long it takes to import modules of all instructions (slowest first). Configuration is read
+from /art/instructions param or from given file. Usage:
+
+    rosrun art_helpers instructions_import_report.py [instructions.yaml]
+"""
+
+import sys
+import time
+import yaml
+import rospy
+from art_helpers import InstructionsHelper
+
+
+def main(args):
+
+    config = None
+
+    if len(args) > 1:
+        with open(args[1]) as f:
+            config = yaml.safe_load(f)
+    else:
+        rospy.init_node('instructions_import_report', anonymous=True)
+
+    start = time.time()
+    ih = InstructionsHelper(config)
+    print("Configuration loaded in " + str(round((time.time() - start) * 1000, 1)) + " ms")
+
+    ih.load_all()
+    print(ih.import_report())
+
+
+if __name__ == '__main__':
+    main(sys.argv)
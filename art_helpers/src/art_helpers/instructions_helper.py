@@ -2,6 +2,8 @@
 
 import rospy
 import importlib
+import threading
+import time
 
 
 class InstructionsHelperException(Exception):
@@ -44,11 +46,31 @@ class BrainInstruction(BaseInstruction):
 
 
 class Instruction(object):
+    """Gui and brain classes of one instruction. Their modules are imported on first access."""
 
-    def __init__(self):
+    def __init__(self, helper, name, conf):
+
+        self._helper = helper
+        self._name = name
+        self._conf = conf
+        self._modules = {}
+
+    def _get(self, art_module, cls):
+
+        if art_module not in self._modules:
+            self._modules[art_module] = self._helper._import_instruction(self._name, self._conf, cls(), art_module)
+
+        return self._modules[art_module]
+
+    @property
+    def gui(self):
+
+        return self._get("gui", GuiInstruction)
+
+    @property
+    def brain(self):
 
-        self.gui = GuiInstruction()
-        self.brain = BrainInstruction()
+        return self._get("brain", BrainInstruction)
 
 
 class InstructionsProperties(object):
@@ -65,14 +87,32 @@ class InstructionsProperties(object):
 
 
 class InstructionsHelper(object):
+    """Provides access to instructions configured in /art/instructions.
 
-    def __init__(self):
+    Properties and names of instructions are available right away, while modules with gui / brain classes
+    are imported on first access (e.g. ih["PickFromFeeder"].gui.learn), so nodes using only properties
+    don't pay for importing them.
+
+    Attributes:
+        import_times (dict): module -> time (in seconds) it took to import it.
+    """
+
+    def __init__(self, config=None):
+        """Loads instructions.
+
+        Args:
+            config (dict): instructions configuration (as in art_instructions/config/instructions.yaml). It is
+                read from /art/instructions param if not given.
+        """
 
         self.packages = frozenset()
         self._instructions = {}
         self.properties = InstructionsProperties()
 
-        self._load()
+        self.import_times = {}
+        self._import_lock = threading.RLock()
+
+        self._load(config)
 
     def __getitem__(self, key):
 
@@ -81,9 +121,9 @@ class InstructionsHelper(object):
         except KeyError:
             raise InstructionsHelperException("Unknown instruction")
 
-    def _load(self):
+    def _load(self, instructions=None):
 
-        while not rospy.is_shutdown():
+        while instructions is None and not rospy.is_shutdown():
             try:
                 instructions = rospy.get_param("/art/instructions")
                 break
@@ -91,7 +131,7 @@ class InstructionsHelper(object):
                 rospy.loginfo("Waiting for /art/instructions param...")
                 rospy.sleep(1.0)
 
-        if rospy.is_shutdown():
+        if instructions is None:
             raise InstructionsHelperException("Shutdown.")
 
         packages = set()
@@ -110,13 +150,11 @@ class InstructionsHelper(object):
 
         for k, ins_conf in instructions["instructions"].iteritems():
 
-            ins = Instruction()
-
-            for art_module, value in ins.__dict__.iteritems():
+            # configuration is checked right away, classes are looked up when the module is imported
+            for art_module, cls in (("gui", GuiInstruction), ("brain", BrainInstruction)):
+                self._check_instruction(k, ins_conf, cls(), art_module)
 
-                self._import_instruction(k, ins_conf, ins.__dict__[art_module], art_module)
-
-            self._instructions[k] = ins
+            self._instructions[k] = Instruction(self, k, ins_conf)
 
         for prop in self.properties.__dict__.keys():
 
@@ -138,15 +176,38 @@ class InstructionsHelper(object):
             self.properties.__dict__[prop] = frozenset(ins_ok)
 
     @staticmethod
-    def _import_instruction(ins_name, ins_conf, ins_cls, art_module):
+    def _check_instruction(ins_name, ins_conf, ins_cls, art_module):
 
         try:
-            pkg = ins_conf[art_module]["package"]
+            ins_conf[art_module]["package"]
         except KeyError:
             raise InstructionsHelperException("Package not defined for: " + ins_name)
 
+        for t in ins_cls.mandatory:
+
+            if t not in ins_conf[art_module]:
+                rospy.logerr("Missing key: " + t)
+                raise InstructionsHelperException("Invalid instruction, key " + t + " is mandatory!")
+
+    def _import_module(self, name):
+
+        with self._import_lock:
+
+            start = time.time()
+            mod = importlib.import_module(name)
+
+            if name not in self.import_times:
+                self.import_times[name] = time.time() - start
+                rospy.logdebug("Imported " + name + " in " + str(round(self.import_times[name] * 1000, 1)) + " ms.")
+
+        return mod
+
+    def _import_instruction(self, ins_name, ins_conf, ins_cls, art_module):
+
+        pkg = ins_conf[art_module]["package"]
+
         try:
-            mod = importlib.import_module(pkg + "." + art_module)
+            mod = self._import_module(pkg + "." + art_module)
         except Exception as e:
             rospy.logerr(str(e))
             raise InstructionsHelperException("Could not import module: " + pkg + "." + art_module)
@@ -158,12 +219,7 @@ class InstructionsHelper(object):
 
             try:
                 cls = ins_conf[art_module][t]
-            except KeyError as e:
-
-                if t in ins_cls.mandatory:
-                    rospy.logerr(str(e))
-                    raise InstructionsHelperException("Invalid instruction, key " + t + " is mandatory!")
-
+            except KeyError:
                 continue
 
             try:
@@ -178,6 +234,26 @@ class InstructionsHelper(object):
         except KeyError:
             pass
 
+        return ins_cls
+
+    def load_all(self):
+        """Imports modules of all instructions (e.g. to find configuration errors early)."""
+
+        for ins in self._instructions.values():
+            ins.gui
+            ins.brain
+
+    def import_report(self):
+        """Returns human readable summary of time spent by importing instruction modules (slowest first)."""
+
+        lines = ["Instruction modules imported: " + str(len(self.import_times)) + ", total " +
+                 str(round(sum(self.import_times.values()) * 1000, 1)) + " ms"]
+
+        for name, t in sorted(self.import_times.items(), key=lambda x: x[1], reverse=True):
+            lines.append("  " + name.ljust(40) + str(round(t * 1000, 1)).rjust(10) + " ms")
+
+        return "\n".join(lines)
+
     def known_instructions(self):
 
         return self._instructions.keys()
@@ -19,12 +19,12 @@ class ProgramHelper(object):
 
     """
 
-    def __init__(self):
+    def __init__(self, ih=None):
 
         self._cache = {}
         self._prog = None
 
-        self.ih = InstructionsHelper()
+        self.ih = ih if ih is not None else InstructionsHelper()
 
     def load(self, prog, template=False):
 
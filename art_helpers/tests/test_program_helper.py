@@ -238,6 +238,11 @@ class TestProgramHelper(unittest.TestCase):
         res = self.ph.load(self.prog)
         self.assertEquals(res, True, "valid program")
 
+    def test_lazy_instructions(self):
+
+        self.ph.load(self.prog)
+        self.assertEquals(len(self.ph.ih.import_times), 0, "test_lazy_instructions")
+
     def test_on_success(self):
 
         res = self.ph.load(self.prog)
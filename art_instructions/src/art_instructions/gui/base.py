@@ -69,3 +69,17 @@ class GuiInstruction(QtCore.QObject):
     def detected_objects(self, msg):
 
         return
+
+    def detected_objects_changed(self, diff):
+        """Called (at most once per frame) when objects were added, removed or moved.
+
+        Args:
+            diff (DetectedObjectsDiff): changes since the previous call, diff.msg holds the latest message.
+        """
+
+        self.detected_objects(diff.msg)
+
+    def polygon_changed(self):
+        """Called when user changed polygon of the instruction."""
+
+        return
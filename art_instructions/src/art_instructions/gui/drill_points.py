@@ -3,7 +3,7 @@ from PyQt4 import QtCore
 import rospy
 from art_msgs.srv import NotifyUserRequest
 import numpy as np
-from art_projected_gui.items import ObjectItem, DialogItem, PolygonItem
+from art_projected_gui.items import DialogItem, PolygonItem
 from math import sqrt
 import tf
 import matplotlib.path as mplPath
@@ -89,9 +89,7 @@ class DrillPointsLearn(DrillPoints):
                 self.ui.select_object_type(obj.object_type.name)
 
                 # TODO avoid code duplication with PICK_FROM_POLYGON
-                for ob in self.ui.get_scene_items_by_type(ObjectItem):
-                    if ob.object_type.name != obj.object_type.name:
-                        continue
+                for ob in self.ui.get_objects(obj.object_type.name):
 
                     # TODO refactor somehow (into ObjectItem?)
                     if not ob.on_table or ob.position[0] < 0 or ob.position[0] > self.ui.width or ob.position[1] < 0 \
@@ -120,10 +118,19 @@ class DrillPointsLearn(DrillPoints):
             self.ui.program_vis.clear_poses()
 
             self.create_drill_dialog()
+            self.update_drill_dialog()
 
-    def detected_objects(self, msg):
+    def detected_objects_changed(self, diff):
 
-        if self.drill_dialog:
+        self.update_drill_dialog()
+
+    def polygon_changed(self):
+
+        self.update_drill_dialog()
+
+    def update_drill_dialog(self):
+
+        if self.drill_dialog and self.ui.ph.is_polygon_set(*self.cid):
 
             sel_obj_type = self.ui.ph.get_object(*self.cid)[0][0]
 
@@ -135,10 +142,9 @@ class DrillPointsLearn(DrillPoints):
             pp.append([0, 0])
             pol = mplPath.Path(np.array(pp), closed=True)
 
-            for obj in msg.instances:
+            for obj in self.ui.get_objects(sel_obj_type):
 
-                if obj.object_type == sel_obj_type and pol.contains_point(
-                        [obj.pose.position.x, obj.pose.position.y]):
+                if pol.contains_point([obj.position[0], obj.position[1]]):
                     self.drill_dialog.set_enabled(True)
                     break
 
@@ -168,6 +174,8 @@ class DrillPointsLearn(DrillPoints):
             self.drill_dialog = DialogItem(
                 self.ui.scene, self.ui.width / 2, 0.1, self.get_drill_caption(), arr, self.save_gripper_pose_drill_cb)
 
+            self.update_drill_dialog()
+
     def save_gripper_pose_drill_cb(self, idx):
 
         # "Right arm", "Left arm", "Prev pose", "Next pose"
@@ -208,10 +216,10 @@ class DrillPointsLearn(DrillPoints):
 
         dist = None
         c_obj = None
-        for obj in self.ui.get_scene_items_by_type(ObjectItem):
+        for obj in self.ui.get_objects(obj_type):
 
-            # skip objects of different type or outside of polygon
-            if obj.object_type.name != obj_type or not pol.contains_point([obj.position[0], obj.position[1]]):
+            # skip objects outside of polygon
+            if not pol.contains_point([obj.position[0], obj.position[1]]):
                 continue
 
             d = sqrt((obj.position[0] - ps.pose.position.x)**2 +
@@ -85,6 +85,15 @@ class PickFromFeederLearn(PickFromFeeder):
             for it in self.grasp_dialog.items:
                 it.set_enabled(False)
 
+            self.update_grasp_dialog()
+
+    def update_grasp_dialog(self):
+
+        if self.grasp_dialog:
+
+            sel_obj_type = self.ui.ph.get_object(*self.cid)[0][0]
+            self.grasp_dialog.set_enabled(any(True for _ in self.ui.get_objects(sel_obj_type)))
+
     def save_gripper_pose_cb(self, idx):
 
         ps = self.ui.rh.get_robot_arms()[idx].get_pose()
@@ -141,6 +150,7 @@ class PickFromFeederLearn(PickFromFeeder):
         self.ui.program_vis.set_object(obj.object_type.name)
         self.ui.select_object_type(obj.object_type.name)
         self.create_grasp_dialog()
+        self.update_grasp_dialog()
 
     def grasp_dialog_timer_tick(self):
 
@@ -182,21 +192,11 @@ class PickFromFeederLearn(PickFromFeeder):
             self.ui.scene.removeItem(self.grasp_dialog)
             self.grasp_dialog = None
 
-    def detected_objects(self, msg):
-
-        if self.grasp_dialog:
-
-            sel_obj_type = self.ui.ph.get_object(*self.cid)[0][0]
-
-            if self.grasp_dialog:
-
-                for obj in msg.instances:
+    def detected_objects_changed(self, diff):
 
-                    if obj.object_type == sel_obj_type:
-                        self.grasp_dialog.set_enabled(True)
-                        break
-                else:
-                    self.grasp_dialog.set_enabled(False)
+        # only presence of objects matters
+        if diff.added or diff.removed:
+            self.update_grasp_dialog()
 
 
 class PickFromFeederRun(PickFromFeeder):
@@ -1,7 +1,7 @@
 from art_instructions.gui import GuiInstruction
 from PyQt4 import QtCore
 import rospy
-from art_projected_gui.items import PolygonItem, ObjectItem
+from art_projected_gui.items import PolygonItem
 from art_projected_gui.helpers import conversions
 
 translate = QtCore.QCoreApplication.translate
@@ -60,9 +60,7 @@ class PickFromPolygonLearn(PickFromPolygon):
             self.ui.program_vis.set_object(obj.object_type.name)
             self.ui.select_object_type(obj.object_type.name)
 
-            for ob in self.ui.get_scene_items_by_type(ObjectItem):
-                if ob.object_type.name != obj.object_type.name:
-                    continue
+            for ob in self.ui.get_objects(obj.object_type.name):
 
                 # TODO refactor somehow (into ObjectItem?)
                 if not ob.on_table or ob.position[0] < 0 or ob.position[0] > self.ui.width or ob.position[1] < 0 \
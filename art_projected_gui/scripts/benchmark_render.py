@@ -0,0 +1,230 @@
+#! /usr/bin/env python
+
+"""
+Measures rendering cost of the projected GUI scene, without projectors, display or the rest of the ROS stack.
+
+UICore scene is populated with objects, places, polygons, square grid and a program and then rendering
+at projector resolution, hit testing and object updates are timed. Results can be written to JSON file and
+compared with results of another run (e.g. from previous commit).
+
+Does not need running roscore, but X server is needed (use xvfb-run on headless machines). Usage:
+
+    rosrun art_projected_gui benchmark_render.py [-o results.json] [-c baseline.json]
+"""
+
+import sys
+import json
+import math
+import timeit
+import argparse
+import subprocess
+from copy import deepcopy
+import yaml
+import rospy
+import rospkg
+from PyQt4 import QtGui, QtCore
+from art_msgs.msg import ObjectType, Program, ProgramBlock, ProgramItem as ProgItem
+from shape_msgs.msg import SolidPrimitive
+from geometry_msgs.msg import PoseStamped
+from art_helpers import InstructionsHelper, ProgramHelper
+from art_projected_gui.gui import UICore
+from art_projected_gui.items import ProgramItem
+
+
+def make_type(name):
+
+    ot = ObjectType()
+    ot.name = name
+    ot.bbox.type = SolidPrimitive.BOX
+    ot.bbox.dimensions = [0.05, 0.05, 0.05]
+    return ot
+
+
+def make_program(blocks, items):
+
+    prog = Program()
+    prog.header.id = 1
+    prog.header.name = "Benchmark"
+
+    for b in range(1, blocks + 1):
+
+        pb = ProgramBlock()
+        pb.id = b
+        pb.name = "Block " + str(b)
+        pb.on_success = b + 1 if b < blocks else 0
+        pb.on_failure = 0
+
+        for i in range(1, items + 1):
+
+            p = ProgItem()
+            p.id = i
+            p.type = "GetReady"
+            p.on_success = i + 1 if i < items else 0
+            p.on_failure = 0
+            pb.items.append(deepcopy(p))
+
+        prog.blocks.append(pb)
+
+    return prog
+
+
+def populate(ui, args):
+
+    types = [make_type("type" + str(i)) for i in range(5)]
+
+    for i in range(args.objects):
+        ui.add_object(str(i), types[i % len(types)], 0.1 + (i % 20) * 0.05, 0.1 + (i // 20) * 0.05, 0.0,
+                      [0, 0, 0, 1])
+
+    ps = PoseStamped()
+    ps.pose.orientation.w = 1.0
+
+    for i in range(args.places):
+        ps.pose.position.x = 0.1 + (i % 20) * 0.05
+        ps.pose.position.y = 0.4 + (i // 20) * 0.05
+        ui.add_place("place " + str(i), ps, types[i % len(types)])
+
+    for i in range(args.polygons):
+        x = 0.1 + (i % 5) * 0.2
+        y = 0.5 + (i // 5) * 0.1
+        ui.add_polygon("polygon " + str(i), poly_points=[(x, y), (x + 0.15, y), (x + 0.15, y + 0.08), (x, y + 0.08)])
+
+    if args.grid > 0:
+
+        poses = []
+
+        for i in range(args.grid):
+            for j in range(args.grid):
+
+                p = PoseStamped()
+                p.pose.orientation.w = 1.0
+                p.pose.position.x = 0.8 + i * 0.1
+                p.pose.position.y = 0.2 + j * 0.1
+                poses.append(p)
+
+        ui.add_square("grid", 0.75, 0.15, args.grid * 0.1, args.grid * 0.1, types[0], poses, fixed=True)
+
+    if args.blocks > 0:
+
+        config = yaml.safe_load(open(rospkg.RosPack().get_path('art_instructions') + '/config/instructions.yaml'))
+        ph = ProgramHelper(InstructionsHelper(config))
+        ph.load(make_program(args.blocks, args.items))
+
+        pi = ProgramItem(ui.scene, 0.01, 0.35, ph, None, ph.ih)
+        pi.set_active(1, 1)
+
+
+def bench(results, name, stmt, number, repeat=3):
+
+    t = min(timeit.repeat(stmt, number=number, repeat=repeat)) / number * 1e3
+    results[name] = t
+    print(name.ljust(30) + "%10.3f ms" % t)
+
+
+def git_revision():
+
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"]).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_fn):
+
+    with open(baseline_fn) as f:
+        baseline = json.load(f)
+
+    print("Comparison with " + str(baseline.get("revision")) + " (" + baseline_fn + "):")
+
+    for name in sorted(results.keys()):
+
+        if name not in baseline["results"]:
+            continue
+
+        old = baseline["results"][name]
+        print(name.ljust(30) + "%10.3f ms -> %10.3f ms (%+.1f %%)" % (old, results[name],
+                                                                       (results[name] - old) / old * 100.0))
+
+
+def main(argv):
+
+    parser = argparse.ArgumentParser(description="Projected GUI render benchmark.")
+    parser.add_argument("-o", "--output", help="write results to JSON file")
+    parser.add_argument("-c", "--compare", help="compare results with JSON file written by previous run")
+    parser.add_argument("--objects", type=int, default=50)
+    parser.add_argument("--places", type=int, default=20)
+    parser.add_argument("--polygons", type=int, default=5)
+    parser.add_argument("--grid", type=int, default=3, help="grid size (grid x grid places)")
+    parser.add_argument("--blocks", type=int, default=5, help="program blocks (0 for no program)")
+    parser.add_argument("--items", type=int, default=50, help="items per program block")
+    parser.add_argument("--resolution", type=int, nargs=2, default=[1920, 1080], metavar=("W", "H"))
+    parser.add_argument("--number", type=int, default=20, help="iterations per measurement")
+    args = parser.parse_args(argv[1:])
+
+    rospy.rostime.set_rostime_initialized(True)
+
+    app = QtGui.QApplication(argv)
+
+    ui = UICore(0, 0, 1.2, 0.75, 1000)
+    populate(ui, args)
+    app.processEvents()
+
+    print("Scene items: " + str(len(ui.scene.items())))
+
+    results = {}
+
+    img = QtGui.QImage(args.resolution[0], args.resolution[1], QtGui.QImage.Format_RGB888)
+
+    def render(antialiasing):
+
+        painter = QtGui.QPainter(img)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, antialiasing)
+        ui.scene.render(painter)
+        painter.end()
+
+    bench(results, "render", lambda: render(False), args.number)
+    bench(results, "render (antialiasing)", lambda: render(True), args.number)
+
+    path = [QtCore.QPointF((0.05 + i * 0.005) * ui.scene.rpm, (0.05 + i * 0.003) * ui.scene.rpm) for i in range(200)]
+
+    def hit_test():
+
+        for pt in path:
+            ui.scene.items(pt)
+
+    bench(results, "hit test (200 points)", hit_test, args.number)
+
+    objects = list(ui.get_objects())
+    step = [0]
+
+    def update_objects():
+
+        step[0] += 1
+        a = step[0] * 0.01
+        q = [0, 0, math.sin(a / 2), math.cos(a / 2)]
+
+        for obj in objects:
+            obj.set_pos(obj.position[0] + 0.001 * math.cos(a), obj.position[1] + 0.001 * math.sin(a))
+            obj.set_orientation(q)
+
+    bench(results, "object updates", update_objects, args.number)
+
+    def update_and_render():
+
+        update_objects()
+        render(True)
+
+    bench(results, "object updates + render", update_and_render, args.number)
+
+    if args.output:
+
+        with open(args.output, "w") as f:
+            json.dump({"revision": git_revision(), "params": vars(args), "results": results}, f, indent=2,
+                      sort_keys=True)
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
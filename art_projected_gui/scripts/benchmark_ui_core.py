@@ -0,0 +1,133 @@
+#! /usr/bin/env python
+
+"""
+Measures cost of object lookups / selections and of hit testing in UICore with many items in the scene.
+Hit testing is measured for all supported item index methods.
+
+Does not need running roscore. Usage:
+
+    rosrun art_projected_gui benchmark_ui_core.py [objects] [other_items]
+"""
+
+import sys
+import timeit
+import rospy
+from PyQt4 import QtGui, QtCore
+from art_msgs.msg import ObjectType
+from shape_msgs.msg import SolidPrimitive
+from geometry_msgs.msg import PoseStamped
+from art_projected_gui.gui import UICore
+from art_projected_gui.helpers import HitTestCache
+
+
+def make_type(name):
+
+    ot = ObjectType()
+    ot.name = name
+    ot.bbox.type = SolidPrimitive.BOX
+    ot.bbox.dimensions = [0.05, 0.05, 0.05]
+    return ot
+
+
+def populate(ui, objects, other_items):
+
+    types = [make_type("type" + str(i)) for i in range(5)]
+
+    for i in range(objects):
+        ui.add_object(str(i), types[i % len(types)], 0.1 + (i % 20) * 0.04, 0.1 + (i // 20) * 0.04, 0.0,
+                      [0, 0, 0, 1])
+
+    ps = PoseStamped()
+    ps.pose.orientation.w = 1.0
+
+    for i in range(other_items):
+        ps.pose.position.x = 0.1 + (i % 20) * 0.04
+        ps.pose.position.y = 0.5 + (i // 20) * 0.04
+        ui.add_place("place " + str(i), ps, types[i % len(types)])
+
+
+def bench(name, stmt, number):
+
+    t = timeit.timeit(stmt, number=number)
+    print(name.ljust(30) + "%10.3f us" % (t / number * 1e6))
+
+
+def bench_hit_test(ui, index):
+
+    probe = QtGui.QGraphicsRectItem(-1, -1, 2, 2, scene=ui.scene)
+    cache = HitTestCache(50)
+    path = [(100 + i * 2, 100 + i) for i in range(200)]
+
+    def naive():
+        for x, y in path:
+            probe.setPos(x, y)
+            for it in ui.scene.items():
+                if it is not probe and probe.collidesWithItem(it):
+                    break
+
+    def indexed():
+        cache.invalidate()
+        for x, y in path:
+            probe.setPos(x, y)
+            for it in ui.scene.items(probe.sceneBoundingRect(), QtCore.Qt.IntersectsItemShape,
+                                     QtCore.Qt.DescendingOrder):
+                if it is not probe and probe.collidesWithItem(it):
+                    break
+
+    def cached():
+        cache.invalidate()
+        for x, y in path:
+            probe.setPos(x, y)
+            for it in cache.items_at(ui.scene, probe.sceneBoundingRect()):
+                if it is not probe and probe.collidesWithItem(it):
+                    break
+
+    bench("hit test, scan (" + index + ")", naive, 5)
+    bench("hit test, query (" + index + ")", indexed, 5)
+    bench("hit test, cached (" + index + ")", cached, 5)
+
+    ui.scene.removeItem(probe)
+
+
+def main(args):
+
+    objects = int(args[1]) if len(args) > 1 else 50
+    other_items = int(args[2]) if len(args) > 2 else 500
+
+    rospy.rostime.set_rostime_initialized(True)
+
+    app = QtGui.QApplication(args)
+
+    ui = UICore(0, 0, 1.2, 0.75, 1000)
+    populate(ui, objects, other_items)
+    app.processEvents()
+
+    print("Objects: " + str(objects) + ", scene items: " + str(len(ui.scene.items())))
+
+    last_id = str(objects - 1)
+
+    bench("get_object", lambda: ui.get_object(last_id), 10000)
+    bench("get_object (missing)", lambda: ui.get_object("missing"), 10000)
+    bench("select_object", lambda: ui.select_object(last_id), 1000)
+    bench("select_object_type", lambda: ui.select_object_type("type1"), 1000)
+
+    def remove_add():
+        obj = ui.get_object(last_id)
+        ui.remove_object(last_id)
+        ui.add_object(last_id, obj.object_type, obj.position[0], obj.position[1], obj.position[2], obj.quaternion)
+
+    bench("remove_object + add_object", remove_add, 1000)
+
+    print("Hit testing (200 pointer moves):")
+
+    for index in sorted(UICore.ITEM_INDEX_METHODS.keys()):
+
+        ui = UICore(0, 0, 1.2, 0.75, 1000, item_index=index)
+        populate(ui, objects, other_items)
+        app.processEvents()
+
+        bench_hit_test(ui, index)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
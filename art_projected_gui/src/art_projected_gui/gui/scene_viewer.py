@@ -12,10 +12,18 @@ class SceneViewer(QtGui.QWidget):
 
         self.pix_label = None
 
+        # cached geometry for get_image (updated on resize / source size change)
+        self.src_size = None
+        self.blit_transform = None
+        self.blit_buffer = None
+
         super(SceneViewer, self).__init__()
 
         self.ns = "/art/interface/projected_gui/"
 
+        # "smooth" (bilinear filtering) or "fast" (nearest neighbour)
+        self.smooth_scaling = rospy.get_param("~quality", "smooth") != "fast"
+
         self.server = rospy.get_param(self.ns + "scene_server")
         self.port = rospy.get_param(self.ns + "scene_server_port")
         rospy.loginfo("Server: " + self.server + ":" + str(self.port))
@@ -96,19 +104,49 @@ class SceneViewer(QtGui.QWidget):
 
             self.get_image(pix)
 
+    def update_blit_geometry(self, src_size):
+        """Precomputes target size and mirror+scale transform for images of src_size."""
+
+        self.src_size = QtCore.QSize(src_size)
+
+        target = src_size.scaled(self.pix_label.size(), QtCore.Qt.KeepAspectRatio)
+
+        if target.isEmpty():
+            self.blit_transform = None
+            self.blit_buffer = None
+            return
+
+        sx = float(target.width()) / src_size.width()
+        sy = float(target.height()) / src_size.height()
+
+        # vertical mirror and scaling in one step
+        self.blit_transform = QtGui.QTransform(sx, 0, 0, -sy, 0, target.height())
+        self.blit_buffer = QtGui.QPixmap(target)
+
     def get_image(self, pix):
 
-        pix = pix.mirrored(vertical=True)
-        image = QtGui.QPixmap.fromImage(
-            pix.scaled(
-                self.pix_label.width(),
-                self.pix_label.height(),
-                QtCore.Qt.KeepAspectRatio,
-                transformMode=QtCore.Qt.SmoothTransformation))
-        self.pix_label.setPixmap(image)
+        if self.src_size is None or pix.size() != self.src_size:
+            self.update_blit_geometry(pix.size())
+
+        if self.blit_buffer is None:
+            return
+
+        # drop label's reference to the buffer so painting does not detach (copy) it
+        self.pix_label.clear()
+
+        painter = QtGui.QPainter(self.blit_buffer)
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform, self.smooth_scaling)
+        painter.setTransform(self.blit_transform)
+        painter.drawImage(0, 0, pix)
+        painter.end()
+
+        self.pix_label.setPixmap(self.blit_buffer)
         self.update()
 
     def resizeEvent(self, event):
 
         if self.pix_label:
             self.pix_label.resize(self.size())
+
+            if self.src_size is not None:
+                self.update_blit_geometry(self.src_size)
@@ -6,7 +6,7 @@ import rospy
 from art_projected_gui.helpers import conversions
 from art_msgs.srv import NotifyUserRequest
 from std_srvs.srv import Empty
-# import time
+import time
 import unicodedata
 
 
@@ -37,13 +37,23 @@ class UICore(QtCore.QObject):
         width (float): Width of the scene.
         height (float): dtto
         rpm (int): Resolution per meter (pixels per meter of width/height).
+        frame_rate (float): How many times per second is the scene rendered (published).
         scene (QGraphicsScene): Holds all Item(s), manages (re)painting etc.
         bottom_label (LabelItem): Label for displaying messages to user.
         scene_items (list): Array to hold all displayed items.
+        objects (dict): ObjectItems added using add_object, indexed by object_id.
+        objects_by_type (dict): Sets of object_ids, indexed by object type name.
+        object_pos_epsilon (float): ObjectItems ignore smaller position changes (meters).
+        object_yaw_epsilon (float): ObjectItems ignore smaller orientation changes (radians).
+        object_smoothing (str): Smoothing of object movement (None, "interpolate" or "extrapolate").
+        animated_objects (set): ObjectItems being moved by animation_timer.
         view (QGraphicsView): To show content of the scene in debug window.
     """
 
-    def __init__(self, x, y, width, height, rpm, notif_origin=(0, 0), font_scale=1.0):
+    ITEM_INDEX_METHODS = {"bsp": QtGui.QGraphicsScene.BspTreeIndex, "none": QtGui.QGraphicsScene.NoIndex}
+
+    def __init__(self, x, y, width, height, rpm, notif_origin=(0, 0), font_scale=1.0, frame_rate=15.0,
+                 item_index="bsp"):
         """
         Args:
             x (float): x coordinate of the scene's origin (in world coordinate system, meters).
@@ -51,10 +61,13 @@ class UICore(QtCore.QObject):
             width (float): Width of the scene.
             height (float): dtto
             rpm (int): Resolution per meter (pixels per meter of width/height).
+            frame_rate (float): Scene rendering rate (Hz).
+            item_index (str): Item index method of the scene ("bsp" or "none").
         """
 
         super(UICore, self).__init__()
 
+        self.frame_rate = frame_rate
         self.x = x
         self.y = y
         self.width = width
@@ -67,8 +80,8 @@ class UICore(QtCore.QObject):
         self.scene.rpm = rpm
         self.scene.font_scale = font_scale
         self.scene.setBackgroundBrush(QtCore.Qt.black)
-        # self.scene.setItemIndexMethod(QtGui.QGraphicsScene.NoIndex) # should
-        # be good for dynamic scenes
+        # BSP tree speeds up hit testing (touches, cursors), no index might be better for very dynamic scenes
+        self.scene.setItemIndexMethod(self.ITEM_INDEX_METHODS[item_index])
 
         self.bottom_label = LabelItem(
             self.scene, notif_origin[0], notif_origin[1], self.width - notif_origin[0], 0.03)
@@ -76,6 +89,18 @@ class UICore(QtCore.QObject):
         self.selected_object_ids = []
         self.selected_object_types = []
 
+        self.objects = {}
+        self.objects_by_type = {}
+
+        self.object_pos_epsilon = 0.0
+        self.object_yaw_epsilon = 0.0
+        self.object_smoothing = None
+
+        # one timer moves all (smoothed) objects, synchronized with the scene rendering
+        self.animated_objects = set()
+        self.animation_timer = QtCore.QTimer()
+        self.animation_timer.timeout.connect(self.animation_tick)
+
         self.view = customGraphicsView(self.scene)
         self.view.setRenderHint(QtGui.QPainter.Antialiasing)
         self.view.setViewportUpdateMode(QtGui.QGraphicsView.FullViewportUpdate)
@@ -147,7 +172,15 @@ class UICore(QtCore.QObject):
             sel_cb (method): Callback which gets called one the object is selected.
         """
 
-        obj = ObjectItem(self.scene, object_id, object_type, x, y, z, quaternion, sel_cb)
+        # there should not be two objects with the same ID
+        self.remove_object(object_id)
+
+        obj = ObjectItem(self.scene, object_id, object_type, x, y, z, quaternion, sel_cb,
+                         pos_epsilon=self.object_pos_epsilon, yaw_epsilon=self.object_yaw_epsilon,
+                         smoothing=self.object_smoothing)
+
+        self.objects[object_id] = obj
+        self.objects_by_type.setdefault(object_type.name, set()).add(object_id)
 
         if object_id in self.selected_object_ids or object_type.name in self.selected_object_types:
 
@@ -156,21 +189,61 @@ class UICore(QtCore.QObject):
     def remove_object(self, object_id):
         """Removes ObjectItem with given object_id from the scene."""
 
-        obj = None
+        obj = self.objects.pop(object_id, None)
 
-        for it in self.get_scene_items_by_type(ObjectItem):
+        if obj is None:
+            return False
 
-            if it.object_id == object_id:
+        self.animated_objects.discard(obj)
 
-                obj = it
-                break
+        ids = self.objects_by_type.get(obj.object_type.name)
 
-        if obj is not None:
+        if ids is not None:
+
+            ids.discard(object_id)
 
+            if not ids:
+                del self.objects_by_type[obj.object_type.name]
+
+        if obj.scene() is not None:
             self.scene.removeItem(obj)
-            return True
 
-        return False
+        return True
+
+    def move_object(self, obj, x, y, z, quaternion, yaw_axis=None, stamp=None):
+        """Sets pose of ObjectItem. When stamp (seconds) is given, movement is smoothed (see object_smoothing)."""
+
+        if obj.set_pose(x, y, z, quaternion, yaw_axis, stamp):
+
+            self.animated_objects.add(obj)
+
+            if not self.animation_timer.isActive():
+                self.animation_timer.start(int(1000.0 / self.frame_rate))
+
+    def animation_tick(self):
+
+        now = time.time()
+
+        for obj in list(self.animated_objects):
+
+            if not obj.animate(now):
+                self.animated_objects.discard(obj)
+
+        if not self.animated_objects:
+            self.animation_timer.stop()
+
+    def get_objects(self, obj_type_name=None):
+        """Generator of ObjectItems (optionally only of given object type)."""
+
+        if obj_type_name is None:
+
+            for obj in self.objects.values():
+                yield obj
+
+        else:
+
+            for obj_id in self.objects_by_type.get(obj_type_name, ()):
+                yield self.objects[obj_id]
 
     def select_object(self, obj_id, unselect_others=True):
         """Sets ObjectItem with given obj_id as selected. By default, all other items are unselected."""
@@ -181,17 +254,17 @@ class UICore(QtCore.QObject):
         if obj_id not in self.selected_object_ids:
             self.selected_object_ids.append(obj_id)
 
-        for it in self.get_scene_items_by_type(ObjectItem):
+        if unselect_others:
 
-            if it.object_id == obj_id:
+            for it in self.objects.values():
 
-                it.set_selected(True)
-                if not unselect_others:
-                    break
+                if it.object_id != obj_id:
+                    it.set_selected(False)
 
-            elif unselect_others:
+        obj = self.objects.get(obj_id)
 
-                it.set_selected(False)
+        if obj is not None:
+            obj.set_selected(True)
 
     def select_object_type(self, obj_type_name, unselect_others=True):
         """
@@ -205,21 +278,20 @@ class UICore(QtCore.QObject):
         if obj_type_name not in self.selected_object_types:
             self.selected_object_types.append(obj_type_name)
 
-        for it in self.get_scene_items_by_type(ObjectItem):
+        if unselect_others:
 
-            if it.object_type.name == obj_type_name:
-                it.set_selected(True)
-            elif unselect_others:
-                it.set_selected(False)
+            for it in self.objects.values():
+
+                if it.object_type.name != obj_type_name:
+                    it.set_selected(False)
+
+        for it in self.get_objects(obj_type_name):
+            it.set_selected(True)
 
     def get_object(self, obj_id):
         """Returns ObjectItem with given object_id or None if the ID is not found."""
 
-        for it in self.get_scene_items_by_type(ObjectItem):
-            if it.object_id == obj_id:
-                return it
-
-        return None
+        return self.objects.get(obj_id)
 
     def add_place(self, caption, pose_stamped, object_type,
                   object_id=None, place_cb=None, fixed=False, dashed=False):
@@ -290,7 +362,7 @@ class UICore(QtCore.QObject):
         self.selected_object_ids = []
         self.selected_object_types = []
 
-        for it in self.get_scene_items_by_type(ObjectItem):
+        for it in self.objects.values():
 
             it.set_selected(False)
 
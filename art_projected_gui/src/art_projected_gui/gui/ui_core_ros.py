@@ -7,7 +7,7 @@ from art_msgs.msg import InstancesArray, InterfaceState, LearningRequestAction,\
     LearningRequestGoal, HololensState, KeyValue
 from art_projected_gui.items import ObjectItem, ButtonItem, PoseStampedCursorItem, LabelItem,\
     ProgramListItem, ProgramItem, DialogItem, PolygonItem
-from art_projected_gui.helpers import conversions
+from art_projected_gui.helpers import conversions, ConcurrentWait, DetectedObjectsTracker
 from art_helpers import InterfaceStateManager, ProgramHelper, ArtRobotHelper, UnknownRobot,\
     RobotParametersNotOnParameterServer
 from art_msgs.srv import NotifyUser, NotifyUserResponse,\
@@ -17,8 +17,16 @@ from std_srvs.srv import Trigger
 from geometry_msgs.msg import PoseStamped
 import actionlib
 from art_utils import array_from_param, ArtApiHelper
+from art_db import ArtDbClient
+from art_db.msg import DbChange
 import tf
 import importlib
+import threading
+import time
+import Queue
+import math
+import heapq
+import itertools
 
 
 translate = QtCore.QCoreApplication.translate
@@ -31,6 +39,9 @@ class UICoreRos(UICore):
     Attributes:
         state_manager (interface_state_manager): synchronization of interfaces within the ARTable system
         art (ArtApiHelper): easy access to ARTable services
+        objects_msgs_merged (int): Unprocessed tracker messages replaced by newer one (lost_objects were merged).
+        objects_msgs_skipped (int): Unprocessed tracker messages replaced by newer one (nothing to merge).
+        program_status (dict): program_id -> (valid, learned), computed in background by program_status_worker.
 
     """
 
@@ -45,7 +56,20 @@ class UICoreRos(UICore):
 
         super(UICoreRos, self).__init__(
             origin[0], origin[1], size[0], size[1], rpm, notif_origin=array_from_param("notif_origin", float, 2),
-            font_scale=rospy.get_param("font_scale", 1.0))
+            font_scale=rospy.get_param("font_scale", 1.0), frame_rate=rospy.get_param("frame_rate", 15.0),
+            item_index=rospy.get_param("item_index", "bsp"))
+
+        # ignore jitter of detected objects
+        self.object_pos_epsilon = rospy.get_param("object_pos_epsilon", 0.002)
+        self.object_yaw_epsilon = math.radians(rospy.get_param("object_yaw_epsilon", 1.0))
+        # "none", "interpolate" or "extrapolate"
+        self.object_smoothing = rospy.get_param("object_smoothing", "none")
+
+        if self.object_smoothing == "none":
+            self.object_smoothing = None
+        elif self.object_smoothing not in ObjectItem.SMOOTHING:
+            rospy.logerr("Unknown object_smoothing: " + str(self.object_smoothing))
+            self.object_smoothing = None
 
         self.tfl = tf.TransformListener()
 
@@ -67,6 +91,17 @@ class UICoreRos(UICore):
                                                                                 "Robot is not holding object."),
         }
 
+        # latest tracker message waiting for processing (coalesced in object_cb)
+        self.objects_msg = None
+        self.objects_lock = threading.Lock()
+        self.objects_last_update = 0.0
+        self.objects_msgs_merged = 0
+        self.objects_msgs_skipped = 0
+
+        # instructions get only changes of detected objects
+        self.objects_diff_tracker = DetectedObjectsTracker(rospy.get_param("object_diff_threshold", 0.01))
+        self.objects_diff_receiver = None
+
         QtCore.QObject.connect(self, QtCore.SIGNAL(
             'objects'), self.object_cb_evt)
 
@@ -84,16 +119,34 @@ class UICoreRos(UICore):
         self.program_widget_pos = array_from_param("program_widget_pos", float, 2, [0.2, self.height - 0.2])
         self.last_edited_prog_id = None
 
-        self.ph = ProgramHelper()
+        self.ph = ProgramHelper(self.ih)
+
+        # program_id -> (valid, learned) - entries are invalidated when art_db announces change of the program
+        # and also explicitly when a program is (possibly) being modified
+        self.program_status = {}
+        self.program_status_versions = {}
+        self.program_status_lock = threading.Lock()
+        self.program_status_queue = Queue.Queue()
+        self.db_changes_sub = rospy.Subscriber('/art/db/changes', DbChange, self.db_changes_cb)
+
+        QtCore.QObject.connect(self, QtCore.SIGNAL(
+            'program_status_evt'), self.program_status_evt)
+
+        QtCore.QObject.connect(self, QtCore.SIGNAL(
+            'startup_progress_evt'), self.startup_progress_evt)
+        QtCore.QObject.connect(self, QtCore.SIGNAL(
+            'startup_done_evt'), self.startup_done_evt)
 
         cursors = rospy.get_param("~cursors", [])
         for cur in cursors:
             PoseStampedCursorItem(self.scene, cur)
 
-        rospy.loginfo("Waiting for /art/brain/learning_request")
+        # notifications can be shown while waiting for the rest of the system
+        self.notify_user_srv = rospy.Service(
+            '/art/interface/projected_gui/notify_user', NotifyUser, self.notify_user_srv_cb)
+
         self.learning_action_cl = actionlib.SimpleActionClient(
             '/art/brain/learning_request', LearningRequestAction)
-        self.learning_action_cl.wait_for_server()
 
         # HoloLens visualization
         self.start_visualizing_srv = rospy.ServiceProxy(
@@ -109,6 +162,7 @@ class UICoreRos(UICore):
             '/art/interface/hololens/state', HololensState, queue_size=1)
 
         self.art = ArtApiHelper()
+        self.db = ArtDbClient()
 
         self.start_learning_srv = rospy.ServiceProxy(
             '/art/brain/learning/start', ProgramIdTrigger)  # TODO wait for service? where?
@@ -138,35 +192,25 @@ class UICoreRos(UICore):
             '/art/brain/program/error_response', ProgramErrorResolve)  # TODO wait for service? where?
         self.program_error_dialog = None
 
-        rospy.loginfo("Waiting for ART services...")
-        self.art.wait_for_api()
-
-        # TODO move this to ArtApiHelper ??
-        self.obj_sub = rospy.Subscriber(
-            '/art/object_detector/object_filtered', InstancesArray, self.object_cb, queue_size=1)
-
-        self.notify_user_srv = rospy.Service(
-            '/art/interface/projected_gui/notify_user', NotifyUser, self.notify_user_srv_cb)
-        try:
-            self.rh = ArtRobotHelper()
-        except UnknownRobot:
-            rospy.logerr("Unknown robot")
-        except RobotParametersNotOnParameterServer:
-            rospy.logerr("Robot parameters not on parameters server")
-            # TODO: what to do? wait until it is loaded?
-
-        self.robot_arms = self.rh.get_robot_arms()
+        self.rh = None
+        self.robot_arms = []
+        self.obj_sub = None
+        self.state_manager = None
 
         self.current_instruction = None
-        self.items_to_keep = []
+        self.items_to_keep = []  # heap of (deadline, sequence number, item)
+        self.items_to_keep_seq = itertools.count()
         self.vis_instructions = []
 
+        # fires only when the earliest item is due
         self.items_to_keep_timer = QtCore.QTimer()
+        self.items_to_keep_timer.setSingleShot(True)
         self.items_to_keep_timer.timeout.connect(self.items_to_keep_timer_tick)
-        self.items_to_keep_timer.start(100)
 
-        self.state_manager = InterfaceStateManager(
-            "PROJECTED UI", cb=self.interface_state_cb)
+        # validation of programs for program list is done in background
+        self.program_status_thread = threading.Thread(target=self.program_status_worker,
+                                                      args=(ProgramHelper(self.ih),))
+        self.program_status_thread.daemon = True
 
         self.plugins = []
 
@@ -184,8 +228,77 @@ class UICoreRos(UICore):
 
             self.plugins.append(getattr(mod, k)(self, v["params"]))
 
+        # waiting for the rest of the system (and plugins) is done in background, so the scene is shown meanwhile
+        self.startup_timeout = rospy.get_param("startup_timeout", 30.0)
+        self.startup_thread = threading.Thread(target=self.startup_worker)
+        self.startup_thread.daemon = True
+        self.startup_thread.start()
+
+    def init_robot_helper(self):
+
+        try:
+            self.rh = ArtRobotHelper()
+        except UnknownRobot:
+            rospy.logerr("Unknown robot")
+        except RobotParametersNotOnParameterServer:
+            rospy.logerr("Robot parameters not on parameters server")
+            # TODO: what to do? wait until it is loaded?
+
+    def startup_worker(self):
+        """Waits (concurrently) for ART services, brain and robot and initializes plugins (runs in its own thread)."""
+
+        tasks = {
+            "learning_request": self.learning_action_cl.wait_for_server,
+            "ART API": self.art.wait_for_api,
+            "robot": self.init_robot_helper
+        }
+
         for plugin in self.plugins:
-            plugin.init()
+            tasks[plugin.__class__.__name__] = plugin.init
+
+        rospy.loginfo("Waiting for: " + ", ".join(sorted(tasks.keys())))
+        start = time.time()
+
+        waiting = ConcurrentWait(tasks, lambda name, pending: self.emit(QtCore.SIGNAL('startup_progress_evt'),
+                                                                        pending, len(tasks)))
+
+        pending = waiting.wait(self.startup_timeout)
+
+        if pending:
+
+            rospy.logerr("Still waiting for: " + ", ".join(pending))
+            self.emit(QtCore.SIGNAL('startup_progress_evt'), pending, len(tasks), True)
+            pending = waiting.wait()
+
+        if pending:  # shutdown
+            return
+
+        rospy.loginfo("Startup took " + str(round(time.time() - start, 1)) + " s.")
+        self.emit(QtCore.SIGNAL('startup_done_evt'))
+
+    def startup_progress_evt(self, pending, total, timeout=False):
+
+        if not pending:
+            return
+
+        msg = translate("UICoreRos", "Starting up (%1/%2), waiting for: %3").arg(total - len(pending)).arg(total)\
+            .arg(", ".join(pending))
+
+        self.notif(msg, temp=True, message_type=NotifyUserRequest.ERROR if timeout else NotifyUserRequest.INFO)
+
+    def startup_done_evt(self):
+
+        if self.rh is not None:
+            self.robot_arms = self.rh.get_robot_arms()
+
+        # TODO move this to ArtApiHelper ??
+        self.obj_sub = rospy.Subscriber(
+            '/art/object_detector/object_filtered', InstancesArray, self.object_cb, queue_size=1)
+
+        self.program_status_thread.start()
+
+        self.state_manager = InterfaceStateManager(
+            "PROJECTED UI", cb=self.interface_state_cb)
 
         rospy.loginfo("Projected GUI ready!")
 
@@ -199,23 +312,39 @@ class UICoreRos(UICore):
         for plugin in self.plugins:
             plugin.notify_warn()
 
+    def keep_items(self, items):
+        """Schedules removal of given scene items. Items are given as ((item1, rospy.Time), ...)."""
+
+        for item, ts in items:
+            heapq.heappush(self.items_to_keep, (ts, next(self.items_to_keep_seq), item))
+
+        self.rearm_items_to_keep_timer()
+
+    def rearm_items_to_keep_timer(self):
+
+        if not self.items_to_keep:
+            self.items_to_keep_timer.stop()
+            return
+
+        wait = (self.items_to_keep[0][0] - rospy.Time.now()).to_sec()
+        self.items_to_keep_timer.start(max(0, int(wait * 1000)) + 1)
+
     def items_to_keep_timer_tick(self):
 
         now = rospy.Time.now()
 
-        to_delete = []
+        deleted = 0
 
-        for item, ts in self.items_to_keep:
+        while self.items_to_keep and self.items_to_keep[0][0] < now:
 
-            if ts < now:
-                self.scene.removeItem(item)
-                to_delete.append((item, ts))
+            _, _, item = heapq.heappop(self.items_to_keep)
+            self.scene.removeItem(item)
+            deleted += 1
 
-        if to_delete:
-            rospy.loginfo("Deleting " + str(len(to_delete)) + " scene item(s).")
+        if deleted:
+            rospy.loginfo("Deleting " + str(deleted) + " scene item(s).")
 
-        for td in to_delete:
-            self.items_to_keep.remove(td)
+        self.rearm_items_to_keep_timer()
 
     def get_error_string(self, error):
 
@@ -533,7 +662,7 @@ class UICoreRos(UICore):
             if items_to_keep:
 
                 rospy.loginfo(str(len(items_to_keep)) + " scene item(s) to be deleted later.")
-                self.items_to_keep.extend(items_to_keep)
+                self.keep_items(items_to_keep)
 
             self.current_instruction = None
 
@@ -750,6 +879,9 @@ class UICoreRos(UICore):
 
             self.last_edited_prog_id = state.program_id
 
+            # program is going to be modified (and stored by brain)
+            self.invalidate_program_status(state.program_id)
+
             if not self.ph.load(self.art.load_program(state.program_id)):
 
                 self.notif(
@@ -932,6 +1064,8 @@ class UICoreRos(UICore):
 
         prog = self.ph.get_program()
 
+        self.invalidate_program_status(prog.header.id)
+
         if not self.art.store_program(prog):
 
             self.notif(
@@ -1044,6 +1178,7 @@ class UICoreRos(UICore):
                     rospy.logerr("Failed to find available program ID")
                     return
 
+                self.invalidate_program_status(prog.header.id)
                 self.art.store_program(prog)
 
                 rospy.loginfo("Program ID=" + str(prog_id) + " templated as ID=" + str(prog.header.id))
@@ -1099,6 +1234,82 @@ class UICoreRos(UICore):
 
         self.emit(QtCore.SIGNAL('learning_request_done_evt'), status, result)
 
+    def db_changes_cb(self, msg):
+
+        if msg.kind == DbChange.PROGRAM:
+            self.invalidate_program_status(int(msg.id))
+
+    def invalidate_program_status(self, program_id):
+
+        with self.program_status_lock:
+
+            self.program_status.pop(program_id, None)
+            self.program_status_versions[program_id] = self.program_status_versions.get(program_id, 0) + 1
+
+    def program_status_worker(self, ph):
+        """Loads and validates programs requested by show_program_list (runs in its own thread)."""
+
+        while not rospy.is_shutdown():
+
+            # all programs requested so far are loaded at once
+            program_ids = [self.program_status_queue.get()]
+
+            try:
+                while True:
+                    program_ids.append(self.program_status_queue.get_nowait())
+            except Queue.Empty:
+                pass
+
+            with self.program_status_lock:
+
+                versions = {}
+
+                for program_id in program_ids:
+                    if program_id not in self.program_status:
+                        versions[program_id] = self.program_status_versions.get(program_id, 0)
+
+            if not versions:
+                continue
+
+            try:
+                programs = self.db.get_programs(versions.keys())
+            except Exception as e:
+                rospy.logerr("Failed to get programs: " + str(e))
+                programs = None
+
+            for program_id, version in versions.iteritems():
+
+                # thread must not die - status of the program stays unknown (it is requested again next time)
+                try:
+
+                    if programs is not None:
+                        prog = programs.get(program_id)
+                    else:
+                        prog = self.art.load_program(program_id)
+
+                    valid = ph.load(prog)
+                    learned = valid and ph.program_learned()
+
+                except Exception as e:
+                    rospy.logerr("Failed to validate program " + str(program_id) + ": " + str(e))
+                    continue
+
+                with self.program_status_lock:
+
+                    # program was stored in the meantime - result might be outdated
+                    if version != self.program_status_versions.get(program_id, 0):
+                        self.program_status_queue.put(program_id)
+                        continue
+
+                    self.program_status[program_id] = (valid, learned)
+
+                self.emit(QtCore.SIGNAL('program_status_evt'), program_id, valid, learned)
+
+    def program_status_evt(self, program_id, valid, learned):
+
+        if self.program_list is not None:
+            self.program_list.set_program_status(program_id, valid, learned)
+
     def show_program_list(self):
 
         self.notif(translate("UICoreRos", "Please select a program"))
@@ -1109,15 +1320,29 @@ class UICoreRos(UICore):
 
         headers_to_show = []
 
+        invalid_ids = []
+
+        with self.program_status_lock:
+            program_status = dict(self.program_status)
+
         for header in headers:
 
-            ph = ProgramHelper()
-            d[header.id] = None
+            headers_to_show.append(header)
+
+            if header.id not in program_status:
 
-            if ph.load(self.art.load_program(header.id)):
+                # list is shown immediately and filled in as programs are validated
+                d[header.id] = None
+                self.program_status_queue.put(header.id)
 
-                headers_to_show.append(header)
-                d[header.id] = ph.program_learned()
+            elif program_status[header.id][0]:
+
+                d[header.id] = program_status[header.id][1]
+
+            else:
+
+                d[header.id] = None
+                invalid_ids.append(header.id)
 
         self.program_list = ProgramListItem(
             self.scene,
@@ -1129,6 +1354,10 @@ class UICoreRos(UICore):
             self.program_selected_cb,
             self.program_selection_changed_cb)
 
+        # invalid programs are shown disabled - in the same way as when they are validated in background
+        for program_id in invalid_ids:
+            self.program_list.set_program_status(program_id, False, False)
+
     def program_selection_changed_cb(self, program_id, ro=False, learned=False):
 
         if program_id is not None:
@@ -1159,21 +1388,64 @@ class UICoreRos(UICore):
 
     def object_cb(self, msg):
 
-        self.emit(QtCore.SIGNAL('objects'), msg)
+        with self.objects_lock:
+
+            if self.objects_msg is not None:
 
-    def object_cb_evt(self, msg):
+                # previous message was not processed yet - keep just the latest one
+                lost = set(self.objects_msg.lost_objects)
+
+                if lost:
+                    self.objects_msgs_merged += 1
+                else:
+                    self.objects_msgs_skipped += 1
+
+                lost.update(msg.lost_objects)
+                lost.difference_update([inst.object_id for inst in msg.instances])
+                msg.lost_objects = list(lost)
+
+                self.objects_msg = msg
+                return
+
+            self.objects_msg = msg
+
+        self.emit(QtCore.SIGNAL('objects'))
+
+    def object_cb_evt(self):
+
+        # process at most one update per frame
+        wait = self.objects_last_update + 1.0 / self.frame_rate - time.time()
+
+        if wait > 0:
+            QtCore.QTimer.singleShot(int(wait * 1000) + 1, self.object_cb_evt)
+            return
+
+        with self.objects_lock:
+            msg = self.objects_msg
+            self.objects_msg = None
+
+        if msg is None:
+            return
+
+        self.objects_last_update = time.time()
 
         for obj_id in msg.lost_objects:
 
             self.remove_object(obj_id)
 
-        for inst in msg.instances:
+        # orientation of all objects is processed at once
+        quaternions = [conversions.q2a(inst.pose.orientation) for inst in msg.instances]
+        axes, angles = conversions.yaw_axes(quaternions) if quaternions else ([], [])
+
+        stamp = msg.header.stamp.to_sec() if not msg.header.stamp.is_zero() else self.objects_last_update
+
+        for idx, inst in enumerate(msg.instances):
 
             obj = self.get_object(inst.object_id)
 
             if obj:
-                obj.set_pos(inst.pose.position.x, inst.pose.position.y, inst.pose.position.z)
-                obj.set_orientation(conversions.q2a(inst.pose.orientation))
+                self.move_object(obj, inst.pose.position.x, inst.pose.position.y, inst.pose.position.z,
+                                 quaternions[idx], (axes[idx], angles[idx]), stamp)
             else:
 
                 obj_type = self.art.get_object_type(inst.object_type)
@@ -1195,8 +1467,12 @@ class UICoreRos(UICore):
 
                     rospy.logerr("Failed to get object type (" + inst.object_type + ") for ID=" + str(inst.object_id))
 
-        if self.current_instruction:
-            self.current_instruction.detected_objects(msg)
+        # instruction which did not get any update yet gets all objects
+        diff = self.objects_diff_tracker.update(msg, self.current_instruction is not self.objects_diff_receiver)
+        self.objects_diff_receiver = self.current_instruction
+
+        if self.current_instruction and diff:
+            self.current_instruction.detected_objects_changed(diff)
 
     def polygon_changed(self, pts):
 
@@ -1206,6 +1482,9 @@ class UICoreRos(UICore):
             self.state_manager.update_program_item(self.ph.get_program_id(
             ), self.program_vis.block_id, self.program_vis.get_current_item())
 
+            if self.current_instruction:
+                self.current_instruction.polygon_changed()
+
     '''
         Method which saves grid points and place poses of all objects in grid.
     '''
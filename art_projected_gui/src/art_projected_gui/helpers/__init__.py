@@ -1 +1,4 @@
 from projector_helper import ProjectorHelper
+from hit_test_cache import HitTestCache
+from concurrent_wait import ConcurrentWait
+from objects_diff import DetectedObjectsDiff, DetectedObjectsTracker
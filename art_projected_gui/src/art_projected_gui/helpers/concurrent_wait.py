@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+import threading
+import time
+import rospy
+
+
+class ConcurrentWait(object):
+    """Runs blocking calls (e.g. waiting for services) concurrently, each of them in its own thread.
+
+    Total time of waiting is then given by the slowest call instead of the sum of all of them.
+    """
+
+    def __init__(self, tasks, done_cb=None):
+        """
+        Args:
+            tasks (dict): name -> callable.
+            done_cb (callable): Called with name of each finished task and list of still pending ones
+                (from the task's thread).
+        """
+
+        self.done_cb = done_cb
+        self.threads = {}
+        self.lock = threading.Lock()
+        self.unfinished = set(tasks.keys())
+
+        for name, fn in tasks.iteritems():
+
+            th = threading.Thread(target=self._run, args=(name, fn))
+            th.daemon = True
+            self.threads[name] = th
+            th.start()
+
+    def _run(self, name, fn):
+
+        try:
+            fn()
+        except Exception as e:
+            rospy.logerr(name + ": " + str(e))
+
+        with self.lock:
+            self.unfinished.discard(name)
+            pending = sorted(self.unfinished)
+
+        if self.done_cb is not None:
+            self.done_cb(name, pending)
+
+    def pending(self):
+
+        with self.lock:
+            return sorted(self.unfinished)
+
+    def wait(self, timeout=None):
+        """Waits until all tasks are finished, or until the timeout (in seconds, shared by all tasks) expires.
+
+        Returns:
+            list: Names of tasks which are still running (they are not interrupted).
+        """
+
+        deadline = None if timeout is None else time.time() + timeout
+
+        for th in self.threads.values():
+
+            if deadline is None:
+                # join without timeout can't be interrupted
+                while th.is_alive() and not rospy.is_shutdown():
+                    th.join(0.5)
+            else:
+                th.join(max(0.0, deadline - time.time()))
+
+        return self.pending()
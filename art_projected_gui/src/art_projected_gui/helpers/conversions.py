@@ -1,4 +1,5 @@
 import tf
+import numpy as np
 from math import pi, sqrt
 from geometry_msgs.msg import Quaternion
 
@@ -47,6 +48,38 @@ def qv_mult(q1, v1):
     )[:3]
 
 
+def yaw_axes(quaternions):
+    """Finds yaw axes and yaw angles for a batch of quaternions at once.
+
+    Yaw axis is the object's axis (0 - x, 1 - y, 2 - z) closest to the world's z-axis (the one object rotates
+    around when lying on a table). Yaw angle (radians) is given by object's x-axis (for yaw axis z)
+    or z-axis (for yaw axes x and y) projected to the xy plane.
+
+    Args:
+        quaternions: sequence of N quaternions (x, y, z, w).
+
+    Returns:
+        tuple: array of N axes indexes, array of N angles
+    """
+
+    q = np.asarray(quaternions, dtype=np.float64).reshape(-1, 4)
+    q = q / np.linalg.norm(q, axis=1)[:, np.newaxis]
+
+    x, y, z, w = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+
+    # first two rows of rotation matrices (columns are rotated unit axes)
+    r0 = np.column_stack((1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)))
+    r1 = np.column_stack((2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)))
+
+    axes = np.argmin(r0 * r0 + r1 * r1, axis=1)
+
+    col = np.where(axes == 2, 0, 2)
+    idx = np.arange(len(q))
+    angles = np.arctan2(r1[idx, col], r0[idx, col])
+
+    return axes, angles
+
+
 def yaw2quaternion(yaw):
 
     quaternion = tf.transformations.quaternion_from_euler(0, 0, yaw / 360.0 * 2 * pi)
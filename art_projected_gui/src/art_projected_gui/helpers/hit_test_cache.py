@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+from PyQt4 import QtCore
+import rospy
+
+
+class HitTestCache(object):
+    """Per-gesture cache of items which might be hit by a (small) moving pointer.
+
+    Candidates are taken from the scene's item index (in descending z-order) for an area around
+    the pointer and they are reused until the pointer leaves the area or the cache gets too old.
+    """
+
+    def __init__(self, margin, max_age=rospy.Duration(0.5)):
+        """
+        Args:
+            margin (float): How much (in pixels) is the queried area larger than the pointer.
+            max_age (rospy.Duration): Candidates older than that are queried again.
+        """
+
+        self.margin = margin
+        self.max_age = max_age
+
+        self.area = None
+        self.stamp = None
+        self.candidates = []
+
+    def invalidate(self):
+
+        self.area = None
+        self.candidates = []
+
+    def items_at(self, scene, rect):
+        """Returns items (topmost first) whose bounding rect intersects given rect (in scene coordinates)."""
+
+        now = rospy.Time.now()
+
+        if self.area is None or not self.area.contains(rect) or now - self.stamp > self.max_age:
+
+            self.area = rect.adjusted(-self.margin, -self.margin, self.margin, self.margin)
+            self.stamp = now
+            self.candidates = scene.items(self.area, QtCore.Qt.IntersectsItemBoundingRect,
+                                          QtCore.Qt.DescendingOrder)
+
+        return [it for it in self.candidates if it.scene() is scene and it.sceneBoundingRect().intersects(rect)]
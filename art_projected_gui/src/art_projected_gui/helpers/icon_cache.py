@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+"""
+Process-wide cache of rasterized icons.
+
+SVG files are parsed and rendered only once for each requested size and the resulting
+QPixmap is shared by all items using the icon.
+"""
+
+from PyQt4 import QtGui, QtCore, QtSvg
+
+_cache = {}
+
+
+def get(path, width, height):
+    """Returns QPixmap with icon fitted into width x height pixels (aspect ratio is kept).
+
+    Must be called from the Qt (GUI) thread.
+    """
+
+    key = (path, int(width), int(height))
+
+    try:
+        return _cache[key]
+    except KeyError:
+        pass
+
+    target = QtCore.QSize(key[1], key[2])
+
+    if target.isEmpty():
+        return QtGui.QPixmap()
+
+    if path.lower().endswith(".svg"):
+
+        renderer = QtSvg.QSvgRenderer(path)
+
+        size = renderer.defaultSize()
+        size.scale(target, QtCore.Qt.KeepAspectRatio)
+
+        pix = QtGui.QPixmap(size)
+        pix.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(pix)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        renderer.render(painter)
+        painter.end()
+
+    else:
+
+        pix = QtGui.QPixmap(path).scaled(target, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+
+    _cache[key] = pix
+
+    return pix
+
+
+def clear():
+
+    _cache.clear()
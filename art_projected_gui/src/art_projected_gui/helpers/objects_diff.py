@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+
+class DetectedObjectsDiff(object):
+    """Changes of detected objects since the previous update.
+
+    Attributes:
+        msg (InstancesArray): The whole (latest) tracker message.
+        added (list): ObjectInstance(s) of objects which were not reported before.
+        moved (list): ObjectInstance(s) of objects which moved more than threshold since they were reported.
+        removed (list): IDs of lost objects.
+    """
+
+    def __init__(self, msg):
+
+        self.msg = msg
+        self.added = []
+        self.moved = []
+        self.removed = []
+
+    def __nonzero__(self):
+
+        return bool(self.added or self.moved or self.removed)
+
+
+class DetectedObjectsTracker(object):
+    """Computes DetectedObjectsDiff for consecutive tracker messages.
+
+    Small movements (noise) are not reported, but they accumulate - object is reported as moved once it gets
+    further than threshold from the position where it was reported for the last time.
+    """
+
+    def __init__(self, threshold=0.01):
+        """
+        Args:
+            threshold (float): Objects moved less than threshold (meters, in any axis) are not reported.
+        """
+
+        self.threshold = threshold
+        self.reported = {}  # object_id -> (x, y, z)
+
+    def update(self, msg, full=False):
+        """Returns changes caused by given InstancesArray message.
+
+        Args:
+            full (bool): All detected objects are reported as added (e.g. for newly created receiver).
+        """
+
+        diff = DetectedObjectsDiff(msg)
+
+        for obj_id in msg.lost_objects:
+
+            if self.reported.pop(obj_id, None) is not None:
+                diff.removed.append(obj_id)
+
+        for inst in msg.instances:
+
+            p = inst.pose.position
+            last = self.reported.get(inst.object_id)
+
+            if last is None or full:
+                diff.added.append(inst)
+            elif abs(p.x - last[0]) > self.threshold or abs(p.y - last[1]) > self.threshold or \
+                    abs(p.z - last[2]) > self.threshold:
+                diff.moved.append(inst)
+            else:
+                continue
+
+            self.reported[inst.object_id] = (p.x, p.y, p.z)
+
+        return diff
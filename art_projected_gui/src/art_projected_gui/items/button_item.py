@@ -2,10 +2,31 @@
 
 from PyQt4 import QtGui, QtCore
 from item import Item
+from art_projected_gui.helpers import icon_cache
 
 translate = QtCore.QCoreApplication.translate
 
 
+def button_size(item, caption, width=None, scale=1.0):
+    """Computes size (in pixels) of button with given caption and width (in meters, None for auto).
+
+    Args:
+        item (Item): any item in the scene (used to convert units).
+    """
+
+    font = QtGui.QFont('Arial', item.get_font_size(scale))
+    metrics = QtGui.QFontMetrics(font)
+
+    if width is None:
+
+        return (metrics.width(caption) + 20 * scale, metrics.height() + 20 * scale)
+
+    br = metrics.boundingRect(QtCore.QRectF(0, 0, item.m2pix(width) - (20 * scale), 10000).toRect(
+    ), QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop | QtCore.Qt.TextWordWrap, caption)
+
+    return (max(br.width() + 20 * scale, item.m2pix(width)), br.height() + 20 * scale)
+
+
 class ButtonItem(Item):
 
     def __init__(
@@ -48,10 +69,7 @@ class ButtonItem(Item):
 
     def set_image(self, image_path):
 
-        self.img = QtGui.QImage()
-        self.img.load(image_path)
-        self.img = self.img.scaled(self.boundingRect().width() * 0.8, self.boundingRect(
-        ).height() * 0.8, QtCore.Qt.KeepAspectRatio | QtCore.Qt.SmoothTransformation)
+        self.img = icon_cache.get(image_path, self.boundingRect().width() * 0.8, self.boundingRect().height() * 0.8)
         self.update()
 
     def boundingRect(self):
@@ -76,22 +94,7 @@ class ButtonItem(Item):
 
     def set_width(self, width):
 
-        font = QtGui.QFont('Arial', self.get_font_size(self.scale))
-        metrics = QtGui.QFontMetrics(font)
-
-        if width is None:
-
-            self.w = metrics.width(self.caption) + 20 * self.scale
-            self.h = metrics.height() + 20 * self.scale
-
-        else:
-
-            br = metrics.boundingRect(QtCore.QRectF(0, 0, self.m2pix(width) - (20 * self.scale), 10000).toRect(
-            ), QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop | QtCore.Qt.TextWordWrap, self.caption)
-
-            self.w = max(br.width() + 20 * self.scale, self.m2pix(width))
-            self.h = br.height() + 20 * self.scale
-
+        self.w, self.h = button_size(self, self.caption, width, self.scale)
         self.update()
 
     def set_background_color(self, color=QtCore.Qt.green):
@@ -144,12 +147,10 @@ class ButtonItem(Item):
 
         if self.img is not None:
 
-            painter.drawImage(
-                QtCore.QRectF(
+            painter.drawPixmap(
+                QtCore.QPointF(
                     (self.w - self.img.width()) / 2,
-                    (self.h - self.img.height()) / 2,
-                    self.img.width(),
-                    self.img.height()),
+                    (self.h - self.img.height()) / 2),
                 self.img)
 
         else:
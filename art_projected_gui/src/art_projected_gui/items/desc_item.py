@@ -13,17 +13,18 @@ class DescItem(Item):
         self.color = QtCore.Qt.gray
         self.hover_color = QtCore.Qt.white
 
+        # text layout (font, bounding rect) is computed only when the content changes
+        self.text_font = None
+        self.text_rect = None
+
         super(DescItem, self).__init__(scene, x, y, parent=parent)
 
-    def boundingRect(self):
+    def _update_layout(self):
 
-        if not self.scene():
-            return QtCore.QRectF()
+        self.text_font = QtGui.QFont(self.default_font, self.get_font_size(self.scale))
+        metrics = QtGui.QFontMetrics(self.text_font)
 
-        font = QtGui.QFont(self.default_font, self.get_font_size(self.scale))
-        metrics = QtGui.QFontMetrics(font)
-
-        return QtCore.QRectF(
+        self.text_rect = QtCore.QRectF(
             metrics.boundingRect(
                 QtCore.QRect(
                     0,
@@ -33,11 +34,26 @@ class DescItem(Item):
                 QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop | QtCore.Qt.TextWordWrap,
                 self.text))
 
+    def boundingRect(self):
+
+        if not self.scene():
+            return QtCore.QRectF()
+
+        if self.text_rect is None:
+            self._update_layout()
+
+        return self.text_rect
+
     def set_content(self, text, scale=1.0, color=None, hover_color=None):
 
+        if text == self.text and scale == self.scale and color in (None, self.color) and \
+                hover_color in (None, self.hover_color):
+            return
+
         self.prepareGeometryChange()
         self.scale = scale
         self.text = text
+        self.text_rect = None
         if color:
             self.color = color
         if hover_color:
@@ -62,7 +78,7 @@ class DescItem(Item):
             painter.setBrush(self.color)
             painter.setPen(self.color)
 
-        font = QtGui.QFont(self.default_font, self.get_font_size(self.scale))
-        painter.setFont(font)
-        painter.drawText(self.boundingRect(), QtCore.Qt.AlignLeft |
+        rect = self.boundingRect()
+        painter.setFont(self.text_font)
+        painter.drawText(rect, QtCore.Qt.AlignLeft |
                          QtCore.Qt.AlignTop | QtCore.Qt.TextWordWrap, self.text)
@@ -1,8 +1,8 @@
 #!/usr/bin/env python
 
-from PyQt4 import QtGui, QtCore, QtSvg
+from PyQt4 import QtGui, QtCore
 from item import Item
-import rospy
+from art_projected_gui.helpers import icon_cache
 
 
 class IconItem(Item):
@@ -23,8 +23,6 @@ class IconItem(Item):
 
         super(IconItem, self).__init__(scene, x, y)
 
-        self.icon = QtSvg.QGraphicsSvgItem(fn, self)
-
         self.setCacheMode(QtGui.QGraphicsItem.ItemCoordinateCache)
         self.setZValue(100)
 
@@ -35,8 +33,7 @@ class IconItem(Item):
         self.w = self.m2pix(w)
         self.h = self.m2pix(h)
 
-        self.icon.setScale(min(self.boundingRect().height() / self.icon.boundingRect().height(),
-                               self.boundingRect().width() / self.icon.boundingRect().width()))
+        self.icon = icon_cache.get(fn, self.w, self.h)
 
     def boundingRect(self):
 
@@ -44,4 +41,7 @@ class IconItem(Item):
 
     def paint(self, painter, option, widget):
 
-        pass
+        if not self.scene():
+            return
+
+        painter.drawPixmap(0, 0, self.icon)
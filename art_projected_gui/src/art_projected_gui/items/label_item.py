@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 
-from PyQt4 import QtGui, QtCore, QtSvg
+from PyQt4 import QtGui, QtCore
 from item import Item
+from art_projected_gui.helpers import icon_cache
 import rospy
 from art_msgs.srv import NotifyUserRequest
 import rospkg
@@ -22,21 +23,14 @@ class LabelItem(Item):
         rospack = rospkg.RosPack()
         self.icons_path = rospack.get_path('art_projected_gui') + '/icons/'
 
-        self.icons = {}
-        self.icons[NotifyUserRequest.INFO] = QtSvg.QGraphicsSvgItem(
-            self.icons_path + 'Antu_dialog-information.svg', self)
-        self.icons[NotifyUserRequest.WARN] = QtSvg.QGraphicsSvgItem(self.icons_path + 'Antu_dialog-warning.svg', self)
-        self.icons[NotifyUserRequest.ERROR] = QtSvg.QGraphicsSvgItem(
-            self.icons_path + 'Antu_emblem-important.svg', self)
-        self.icons[NotifyUserRequest.YES_NO_QUESTION] = QtSvg.QGraphicsSvgItem(
-            self.icons_path + 'Antu_dialog-question.svg', self)
-
         s = self.m2pix(self.h)
-        for k, v in self.icons.iteritems():
 
-            v.setScale(s / v.boundingRect().height())
-            v.setPos(0, 0)
-            v.setVisible(False)
+        self.icons = {}
+        self.icons[NotifyUserRequest.INFO] = icon_cache.get(self.icons_path + 'Antu_dialog-information.svg', s, s)
+        self.icons[NotifyUserRequest.WARN] = icon_cache.get(self.icons_path + 'Antu_dialog-warning.svg', s, s)
+        self.icons[NotifyUserRequest.ERROR] = icon_cache.get(self.icons_path + 'Antu_emblem-important.svg', s, s)
+        self.icons[NotifyUserRequest.YES_NO_QUESTION] = icon_cache.get(
+            self.icons_path + 'Antu_dialog-question.svg', s, s)
 
         self.timer = rospy.Timer(rospy.Duration(0.5), self.timer_cb)
         self.setCacheMode(QtGui.QGraphicsItem.ItemCoordinateCache)
@@ -110,12 +104,8 @@ class LabelItem(Item):
 
             msg["shown_at"] = rospy.Time.now()
 
-        for k, v in self.icons.iteritems():
-
-            if k == msg["type"]:
-                v.setVisible(True)
-            else:
-                v.setVisible(False)
+        if msg["type"] in self.icons:
+            painter.drawPixmap(0, 0, self.icons[msg["type"]])
 
         painter.setBrush(QtCore.Qt.white)
         painter.setPen(QtCore.Qt.white)
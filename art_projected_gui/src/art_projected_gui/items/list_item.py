@@ -2,7 +2,7 @@
 
 from PyQt4 import QtGui, QtCore
 from item import Item
-from button_item import ButtonItem
+from button_item import ButtonItem, button_size
 import rospkg
 
 translate = QtCore.QCoreApplication.translate
@@ -11,7 +11,87 @@ rospack = rospkg.RosPack()
 icons_path = rospack.get_path('art_projected_gui') + '/icons/'
 
 
+class ListRow(object):
+    """State of one row of ListItem.
+
+    Graphics item (ButtonItem) is assigned to the row only while the row is displayed. Methods mirror the ones of
+    ButtonItem so rows can be modified regardless of whether they are currently visible or not.
+    """
+
+    def __init__(self, list_item, idx, caption):
+
+        self.list_item = list_item
+        self.idx = idx
+        self.caption = caption
+        self.background_color = QtCore.Qt.green
+        self.enabled = True
+        self.pressed = False
+        self.height = None  # cached height in pixels, computed when needed
+        self.btn = None
+
+    def get_height(self):
+
+        if self.height is None:
+            self.height = button_size(self.list_item, self.caption, self.list_item.item_width)[1]
+
+        return self.height
+
+    def bind(self, btn):
+
+        self.btn = btn
+        btn.list_row = self
+        btn.set_caption(self.caption, self.list_item.item_width)
+        btn.set_background_color(self.background_color)
+        btn.set_enabled(self.enabled)
+        btn.set_pressed(self.pressed)
+
+    def unbind(self):
+
+        btn = self.btn
+        self.btn = None
+        btn.list_row = None
+        return btn
+
+    def set_caption(self, caption):
+
+        self.caption = caption
+        self.height = None
+
+        if self.btn is not None:
+            self.btn.set_caption(caption, self.list_item.item_width)
+            self.list_item.refresh()
+
+    def set_background_color(self, color=QtCore.Qt.green):
+
+        self.background_color = color
+
+        if self.btn is not None:
+            self.btn.set_background_color(color)
+
+    def set_enabled(self, state, also_set_visibility=False):
+
+        self.enabled = state
+
+        if self.btn is not None:
+            self.btn.set_enabled(state)
+
+    def set_pressed(self, state):
+
+        self.pressed = state
+
+        if self.btn is not None:
+            self.btn.set_pressed(state)
+
+
 class ListItem(Item):
+    """Scrollable list of push buttons.
+
+    Only rows fitting into the list (plus a few spare ones) have their graphics item, which are recycled when the
+    list is scrolled. Rows are accessible (e.g. to change their color) through the items attribute.
+    """
+
+    # how many hidden buttons are kept for reuse
+    SPARE_BUTTONS = 2
 
     def __init__(self, scene, x, y, w, data, item_selected_cb=None, parent=None):
 
@@ -23,20 +103,20 @@ class ListItem(Item):
 
         super(ListItem, self).__init__(scene, x, y, parent=parent)
 
+        self.item_width = w
         self.w = self.m2pix(w)
         self.h = self.m2pix(0.2)
         self.sp = self.m2pix(0.005)
 
-        self.items = []
+        self.items = [ListRow(self, idx, d) for idx, d in enumerate(data)]
+
+        # rows with assigned button and unused buttons
+        self.displayed = []
+        self.spare_buttons = []
 
         self.middle_item_idx = 0
         self.selected_item_idx = None
 
-        for d in data:
-
-            self.items.append(ButtonItem(self.scene(), 0, 0,
-                                         d, self, self.item_clicked_cb, width=w, push_button=True))
-
         # TODO down_btn is not properly aligned
         self.up_btn = ButtonItem(self.scene(), 0, 0, "", self, self.up_btn_cb, width=w / 2 - 0.005 / 2,
                                  image_path=icons_path + "arrow-up.svg")
@@ -47,30 +127,30 @@ class ListItem(Item):
         self.down_btn.setPos(self.up_btn.boundingRect().width() + self.sp,
                              self.h - self.down_btn.boundingRect().height())
 
-        self.set_current_idx(min(1, len(self.items) - 1))
+        if self.items:
+            self.set_current_idx(min(1, len(self.items) - 1))
 
         self.update()
 
     def item_clicked_cb(self, btn):
 
-        if not self.isEnabled():
+        if not self.isEnabled() or btn.list_row is None:
 
             return
 
+        btn.list_row.pressed = btn.pressed
+
         if not btn.pressed:
 
             self.selected_item_idx = None
 
         else:
 
-            self.selected_item_idx = self.items.index(btn)
-
-            for i in range(0, len(self.items)):
+            if self.selected_item_idx is not None:
 
-                if i != self.selected_item_idx:
-
-                    self.items[i].set_pressed(False)
+                self.items[self.selected_item_idx].set_pressed(False)
 
+            self.selected_item_idx = btn.list_row.idx
             self.set_current_idx(self.selected_item_idx)
 
         if self.item_selected_cb is not None:
@@ -81,68 +161,94 @@ class ListItem(Item):
 
         return self.middle_item_idx
 
-    def set_current_idx(self, idx, select=False):
+    def refresh(self):
 
-        if select:
+        if self.items:
+            self.set_current_idx(self.middle_item_idx)
 
-            self.selected_item_idx = idx
+    def _get_button(self):
 
-        self.middle_item_idx = max(idx, min(1, len(self.items) - 1))
+        if self.spare_buttons:
 
-        for it in self.items:
+            return self.spare_buttons.pop()
 
-            it.setVisible(False)
+        return ButtonItem(self.scene(), 0, 0, "", self, self.item_clicked_cb, width=self.item_width,
+                          push_button=True)
 
-            if select:
-                it.set_pressed(False)
+    def set_current_idx(self, idx, select=False):
 
-        displayed = [self.middle_item_idx]
+        if select:
 
-        # selected item is always vertically centered
-        self.items[self.middle_item_idx].setPos(
-            0, (self.h - self.items[self.middle_item_idx].boundingRect().height()) / 2)
-        self.items[self.middle_item_idx].setVisible(True)
+            if self.selected_item_idx is not None:
+                self.items[self.selected_item_idx].set_pressed(False)
 
-        if select:
-            self.items[self.selected_item_idx].set_pressed(True)
+            self.selected_item_idx = idx
+            self.items[idx].set_pressed(True)
 
-        # how much vert. space is used
-        vspace = self.items[self.middle_item_idx].boundingRect().height()
+        self.middle_item_idx = max(idx, min(1, len(self.items) - 1))
+
+        # selected item is always vertically centered
+        h = self.items[self.middle_item_idx].get_height()
+        pos = {self.middle_item_idx: (self.h - h) / 2}
 
         # fill space above middle item
+        y = pos[self.middle_item_idx]
+
         for idx in range(self.middle_item_idx - 1, -1, -1):
 
-            h = self.items[idx].boundingRect().height()
-            y = self.items[idx + 1].y() - self.sp - h
+            y -= self.sp + self.items[idx].get_height()
 
             if y < 0:
                 break
 
-            self.items[idx].setPos(0, y)
-            self.items[idx].setVisible(True)
-            displayed.append(idx)
-            vspace += self.sp + h
-            displayed.append(idx)
+            pos[idx] = y
 
         # fill space below middle item
+        y = pos[self.middle_item_idx] + h + self.sp
+
         for idx in range(self.middle_item_idx + 1, len(self.items)):
 
-            h = self.items[idx].boundingRect().height()
-            y = self.items[idx - 1].y() + self.items[idx -
-                                                     1].boundingRect().height() + self.sp
+            h = self.items[idx].get_height()
 
             if y + h > self.down_btn.y():
                 break
 
-            self.items[idx].setPos(0, y)
-            self.items[idx].setVisible(True)
-            vspace += self.sp + h
-            displayed.append(idx)
+            pos[idx] = y
+            y += h + self.sp
+
+        # release buttons of rows which are not displayed anymore
+        for idx in self.displayed:
+
+            if idx in pos:
+                continue
+
+            btn = self.items[idx].unbind()
+
+            if len(self.spare_buttons) < self.SPARE_BUTTONS + len(pos):
+
+                btn.setVisible(False)
+                self.spare_buttons.append(btn)
+
+            else:
+
+                self.scene().removeItem(btn)
+
+        for idx, y in pos.iteritems():
+
+            row = self.items[idx]
+
+            if row.btn is None:
+                row.bind(self._get_button())
+
+            row.btn.setPos(0, y)
+            row.btn.setVisible(True)
+
+        self.displayed = sorted(pos.keys())
 
         if self.isEnabled():
 
-            self.up_btn.set_enabled(min(displayed) > 0)
-            self.down_btn.set_enabled(max(displayed) < len(self.items) - 1)
+            self.up_btn.set_enabled(self.displayed[0] > 0)
+            self.down_btn.set_enabled(self.displayed[-1] < len(self.items) - 1)
 
     def up_btn_cb(self, btn):
 
@@ -9,6 +9,7 @@ from PyQt4 import QtGui, QtCore
 from item import Item
 from desc_item import DescItem
 import math
+import time
 import numpy as np
 import tf
 from art_projected_gui.helpers import conversions
@@ -22,10 +23,31 @@ class ObjectItem(Item):
 
     It currently supports only rotation around z-axis.
 
+    Changes of position (orientation) smaller than pos_epsilon (yaw_epsilon) are ignored
+    in order to avoid repainting because of noise.
+
+    Poses coming from the tracker (set_pose with stamp) can be smoothed - the item then moves towards
+    the new pose ("interpolate") or keeps moving with the last velocity ("extrapolate") for the duration
+    of one tracker period. The movement is driven by calling animate (e.g. from UICore).
+
     """
 
+    SMOOTHING = (None, "interpolate", "extrapolate")
+
     def __init__(self, scene, object_id, object_type, x,
-                 y, z, quaternion=(0, 0, 0, 1), sel_cb=None, selected=False, parent=None, dashed=False):
+                 y, z, quaternion=(0, 0, 0, 1), sel_cb=None, selected=False, parent=None, dashed=False,
+                 pos_epsilon=0.0, yaw_epsilon=0.0, smoothing=None):
+
+        assert smoothing in self.SMOOTHING
+
+        self.pos_epsilon = pos_epsilon  # meters
+        self.yaw_epsilon = yaw_epsilon  # radians
+        self.oriented_z = None  # z coordinate used when orientation was set for the last time
+
+        self.smoothing = smoothing
+        self.yaw_rotation = 0.0  # rotation (degrees) corresponding to the last orientation
+        self.last_sample = None  # (stamp, (x, y, rotation)) of the last tracker pose
+        self.motion = None  # (start, duration, from (x, y, rotation), to (x, y, rotation))
 
         self.object_id = object_id
         self.selected = selected
@@ -81,61 +103,75 @@ class ObjectItem(Item):
                     2 +
                     self.m2pix(0.01)))
 
-    def set_pos(self, x, y, z=None, parent_coords=False):
+    def _pos_changed(self, x, y, z):
 
-        super(ObjectItem, self).set_pos(x, y, z, parent_coords)
-        self._update_desc_pos()
-        self.update_text()
+        if self.desc is None:  # called from constructor
+            return True
 
-    def get_yaw_axis(self):
+        eps = self.pos_epsilon
 
-        ax = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+        return abs(x - self.position[0]) > eps or abs(y - self.position[1]) > eps or \
+            (z is not None and abs(z - self.position[2]) > eps)
 
-        c_idx = None
-        c_dist = None
+    def _orientation_changed(self, q):
 
-        for idx in range(len(ax)):
+        if self.oriented_z is None or abs(self.position[2] - self.oriented_z) > self.pos_epsilon:
+            return True
 
-            res = conversions.qv_mult(self.quaternion, ax[idx])
+        # angle between the current and the new orientation
+        dot = min(1.0, abs(sum(a * b for a, b in zip(self.quaternion, q))))
 
-            dist = math.sqrt(res[0]**2 + res[1]**2)
+        return 2 * math.acos(dot) > self.yaw_epsilon
 
-            if c_dist is None or c_dist > dist:
+    def set_pos(self, x, y, z=None, parent_coords=False):
 
-                c_dist = dist
-                c_idx = idx
+        if not self._pos_changed(x, y, z):
+            return
+
+        super(ObjectItem, self).set_pos(x, y, z, parent_coords)
+        self._update_desc_pos()
+        self.update_text()
+
+    def get_yaw_axis(self):
 
         # TODO disable object (return -1) if dist is too high?
+        return conversions.yaw_axes([self.quaternion])[0][0]
 
-        return c_idx
+    def set_orientation(self, q, yaw_axis=None):
+        """Sets object's orientation.
 
-    def set_orientation(self, q):
+        Args:
+            q: quaternion (x, y, z, w)
+            yaw_axis (tuple): (axis, angle) as returned by conversions.yaw_axes - when orientation of more
+                              objects is updated at once, it could be computed for all of them in one call.
+        """
+
+        if not self._orientation_changed(q):
+            return
 
         self.quaternion = q
+        self.oriented_z = self.position[2]
+
+        if yaw_axis is None:
+            axes, angles = conversions.yaw_axes([q])
+            yaw_axis = (axes[0], angles[0])
 
-        ax = self.get_yaw_axis()
+        ax, angle = yaw_axis
 
         if ax == ObjectItem.Z:
 
             self.lx = self.m2pix(self.inflate + self.object_type.bbox.dimensions[0])
             self.ly = self.m2pix(self.inflate + self.object_type.bbox.dimensions[1])
 
-            sres = conversions.qv_mult(self.quaternion, (1, 0, 0))
-            angle = math.atan2(sres[1], sres[0])
-
             self.on_table = self.position[2] < self.object_type.bbox.dimensions[2] + 0.05
 
         elif ax in [ObjectItem.X, ObjectItem.Y]:
 
-            res = conversions.qv_mult(self.quaternion, (0, 0, 1))
-
             self.lx = self.m2pix(self.inflate + self.object_type.bbox.dimensions[2])
 
             # TODO use correct dimension (x/y) - now let's assume that x and y dimensions are same
             self.ly = self.m2pix(self.inflate + self.object_type.bbox.dimensions[1])
 
-            angle = math.atan2(res[1], res[0])
-
             self.on_table = self.position[2] < self.object_type.bbox.dimensions[0] + 0.05
 
         else:
@@ -143,13 +179,107 @@ class ObjectItem(Item):
             self.set_enabled(False, True)
             return
 
-        self.setRotation(-angle / (math.pi * 2) * 360)
+        self.yaw_rotation = -angle / (math.pi * 2) * 360
+        self.setRotation(self.yaw_rotation)
 
         # TODO if not on table - display somewhere list of detected objects or what?
         self.set_enabled(self.on_table, True)
 
         self.update()
 
+    def set_pose(self, x, y, z, q, yaw_axis=None, stamp=None):
+        """Sets position and orientation, optionally smoothed (see the class description).
+
+        Args:
+            stamp (float): Time (seconds) when the pose was measured - smoothing is used only when given.
+
+        Returns:
+            bool: True if the item is moving (animate should be called).
+        """
+
+        shown = self._shown_pose()
+
+        self.set_pos(x, y, z)
+        self.set_orientation(q, yaw_axis)
+
+        if self.smoothing is None or stamp is None:
+            self.motion = None
+            return False
+
+        target = (self.position[0], self.position[1], self.yaw_rotation)
+        last = self.last_sample
+        self.last_sample = (stamp, target)
+
+        if last is None or stamp <= last[0]:
+            self.motion = None
+            return False
+
+        # one tracker period (at least one frame, at most 0.5 s)
+        duration = min(0.5, max(0.02, stamp - last[0]))
+
+        if self.smoothing == "interpolate":
+            a, b = shown, target
+        else:
+            prev = last[1]
+            a, b = target, (2 * target[0] - prev[0], 2 * target[1] - prev[1],
+                            target[2] + self._angle_diff(prev[2], target[2]))
+
+        # static object - there is nothing to animate
+        if self._same_pose(shown, a) and self._same_pose(a, b):
+            self.motion = None
+            return False
+
+        self.motion = (time.time(), duration, a, b)
+
+        # set_pos / set_orientation moved the item to the target - go back to the beginning of the motion
+        return self.animate(self.motion[0])
+
+    def _same_pose(self, a, b):
+        """Poses (x, y, rotation) differ at most by pos_epsilon / yaw_epsilon (or by rounding errors)."""
+
+        eps = max(self.pos_epsilon, 1e-4)
+
+        return abs(a[0] - b[0]) <= eps and abs(a[1] - b[1]) <= eps and \
+            abs(self._angle_diff(a[2], b[2])) <= max(math.degrees(self.yaw_epsilon), 0.01)
+
+    def _shown_pose(self):
+
+        x, y = self.get_pos()
+        return x, y, self.rotation()
+
+    @staticmethod
+    def _angle_diff(a, b):
+
+        return (b - a + 180.0) % 360.0 - 180.0
+
+    def animate(self, now):
+        """Moves the item according to the current motion.
+
+        Returns:
+            bool: False if the motion is finished.
+        """
+
+        if self.motion is None:
+            return False
+
+        start, duration, a, b = self.motion
+        k = max(0.0, min(1.0, (now - start) / duration))
+
+        (px, py) = self.m2pix(a[0] + (b[0] - a[0]) * k, a[1] + (b[1] - a[1]) * k)
+
+        if self.parentItem():
+            self.setPos(self.parentItem().mapFromScene(px, py))
+        else:
+            self.setPos(px, py)
+
+        self.setRotation(a[2] + self._angle_diff(a[2], b[2]) * k)
+        self._update_desc_pos()
+
+        if k >= 1.0:
+            self.motion = None
+
+        return self.motion is not None
+
     def update_text(self):
 
         if self.desc is None:
@@ -7,6 +7,7 @@ from geometry_msgs.msg import PoseStamped
 from touch_table_item import TouchTableItem
 from desc_item import DescItem
 from button_item import ButtonItem
+from art_projected_gui.helpers import HitTestCache
 
 # TODO optional filtering (kalman?)
 # TODO option to select when hovered for some time (instead of 'click')
@@ -57,6 +58,9 @@ class PoseStampedCursorItem(Item):
 
         self.last_pt = None
 
+        self.hit_cache = HitTestCache(40)
+        self.hovered_items = []
+
         self.setFlag(QtGui.QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QtGui.QGraphicsItem.ItemIsSelectable, True)
         self.setCacheMode(QtGui.QGraphicsItem.DeviceCoordinateCache)
@@ -117,7 +121,9 @@ class PoseStampedCursorItem(Item):
 
         if self.pointed_item is None:
 
-            for it in self.scene().items():
+            hovered_items = []
+
+            for it in self.hit_cache.items_at(self.scene(), self.sceneBoundingRect()):
 
                 if not isinstance(it, Item):  # TODO skip item not derived from Item
                     continue
@@ -138,6 +144,7 @@ class PoseStampedCursorItem(Item):
                         it = it.parentItem()
 
                     it.set_hover(True, self)
+                    hovered_items.append(it)
 
                     if mouse and not click:
                         continue
@@ -156,10 +163,13 @@ class PoseStampedCursorItem(Item):
                     self.offset = (it_pos[0] - my_pos[0], it_pos[1] - my_pos[1])
                     click = False
 
-                else:
-
+            # items which were hovered but are not anymore
+            for it in self.hovered_items:
+                if it not in hovered_items:
                     it.set_hover(False, self)
 
+            self.hovered_items = hovered_items
+
         if self.pointed_item is not None:
 
             mm = max(abs(pt.x() - self.last_pt.x()), abs(pt.y() - self.last_pt.y()))
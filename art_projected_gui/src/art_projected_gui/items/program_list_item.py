@@ -23,11 +23,17 @@ class ProgramListItem(Item):
             program_selected_cb=None,
             program_selection_changed_cb=None):
 
+        """
+        Args:
+            learned_dict (dict): program_id -> learned (bool) or None if not known yet (see set_program_status).
+        """
+
         self.w = 100
         self.h = 100
 
         self.program_headers = program_headers
         self.learned_dict = learned_dict
+        self.invalid_ids = set()
         self.program_selected_cb = program_selected_cb
         self.program_selection_changed_cb = program_selection_changed_cb
 
@@ -60,7 +66,7 @@ class ProgramListItem(Item):
 
         for idx in range(0, len(data)):
 
-            if not self.learned_dict[self.map_from_idx_to_program_id[idx]]:
+            if self.learned_dict[self.map_from_idx_to_program_id[idx]] is False:
                 self.list.items[idx].set_background_color(QtCore.Qt.red)
 
         rospack = rospkg.RosPack()
@@ -104,9 +110,38 @@ class ProgramListItem(Item):
 
         self.update()
 
+    def set_program_status(self, program_id, valid, learned):
+        """Updates status of program which was not known when the list was created."""
+
+        if program_id not in self.map_from_program_id_to_idx:
+            return
+
+        idx = self.map_from_program_id_to_idx[program_id]
+
+        if not valid:
+
+            self.invalid_ids.add(program_id)
+            self.learned_dict[program_id] = None
+            self.list.items[idx].set_enabled(False)
+
+        else:
+
+            self.invalid_ids.discard(program_id)
+            self.learned_dict[program_id] = learned
+            self.list.items[idx].set_enabled(True)
+
+            if learned:
+                self.list.items[idx].set_background_color()
+            else:
+                self.list.items[idx].set_background_color(QtCore.Qt.red)
+
+        if self.list.selected_item_idx == idx:
+            self.item_selected_cb()
+
     def item_selected_cb(self):
 
-        if self.list.selected_item_idx is None:
+        if self.list.selected_item_idx is None or \
+                self.map_from_idx_to_program_id[self.list.selected_item_idx] in self.invalid_ids:
 
             self.run_btn.set_enabled(False)
             self.edit_btn.set_enabled(False)
@@ -119,7 +154,7 @@ class ProgramListItem(Item):
         else:
 
             pid = self.map_from_idx_to_program_id[self.list.selected_item_idx]
-            self.run_btn.setEnabled(self.learned_dict[pid])
+            self.run_btn.setEnabled(self.learned_dict[pid] is True)
 
             for ph in self.program_headers:
 
@@ -132,7 +167,7 @@ class ProgramListItem(Item):
             self.visualize_btn.set_enabled(True)
 
             if self.program_selection_changed_cb:
-                self.program_selection_changed_cb(ph.id, ro=ph.readonly, learned=self.learned_dict[ph.id])
+                self.program_selection_changed_cb(ph.id, ro=ph.readonly, learned=self.learned_dict[ph.id] is True)
 
     def get_current_header(self):
 
@@ -7,6 +7,7 @@ from art_msgs.msg import Touch
 from desc_item import DescItem
 from button_item import ButtonItem
 from label_item import LabelItem
+from art_projected_gui.helpers import HitTestCache
 
 
 class TouchPointItem(Item):
@@ -17,6 +18,7 @@ class TouchPointItem(Item):
         self.offset = (0, 0)
         self.last_update = rospy.Time.now()
         self.show = show
+        self.hit_cache = HitTestCache(scene.rpm * 0.05)
 
         super(TouchPointItem, self).__init__(scene, x, y, parent)
 
@@ -42,7 +44,7 @@ class TouchPointItem(Item):
 
         if self.pointed_item is None:
 
-            for it in self.scene().items():
+            for it in self.hit_cache.items_at(self.scene(), self.sceneBoundingRect()):
 
                 if not isinstance(it, Item):  # TODO skip item not derived from Item
                     continue
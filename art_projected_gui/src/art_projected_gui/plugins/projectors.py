@@ -3,7 +3,7 @@ import rospy
 from PyQt4 import QtCore
 from std_msgs.msg import Bool
 from std_srvs.srv import Trigger, TriggerResponse
-from art_projected_gui.helpers import ProjectorHelper
+from art_projected_gui.helpers import ProjectorHelper, ConcurrentWait
 
 translate = QtCore.QCoreApplication.translate
 
@@ -39,8 +39,8 @@ class ProjectorsPlugin(GuiPlugin):
 
         if self.projectors:
             rospy.loginfo("Waiting for projector nodes...")
+            ConcurrentWait({proj.proj_id: proj.wait_until_available for proj in self.projectors}).wait()
             for proj in self.projectors:
-                proj.wait_until_available()
                 if not proj.is_calibrated():
                     proj_calib = False
 
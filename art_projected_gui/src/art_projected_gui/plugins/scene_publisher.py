@@ -26,7 +26,7 @@ class ScenePublisherPlugin(GuiPlugin):
             self.scene_timer,
             QtCore.SIGNAL('timeout()'),
             self.send_to_clients_evt)
-        self.scene_timer.start(1.0 / 15 * 1000)
+        self.scene_timer.start(1.0 / self.ui.frame_rate * 1000)
 
     def new_connection(self):
 
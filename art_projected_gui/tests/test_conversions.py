@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+import math
+import unittest
+import tf
+from art_projected_gui.helpers import conversions
+
+
+def yaw_axis_reference(q):
+    """Per-quaternion computation (as done by ObjectItem before yaw_axes was introduced)."""
+
+    c_idx = None
+    c_dist = None
+
+    for idx, ax in enumerate(((1, 0, 0), (0, 1, 0), (0, 0, 1))):
+
+        res = conversions.qv_mult(q, ax)
+        dist = math.sqrt(res[0]**2 + res[1]**2)
+
+        if c_dist is None or c_dist > dist:
+
+            c_dist = dist
+            c_idx = idx
+
+    res = conversions.qv_mult(q, (1, 0, 0) if c_idx == 2 else (0, 0, 1))
+
+    return c_idx, math.atan2(res[1], res[0])
+
+
+class TestConversions(unittest.TestCase):
+
+    QUATERNIONS = (
+        tf.transformations.quaternion_from_euler(0, 0, 0.5),  # z-axis up
+        tf.transformations.quaternion_from_euler(0, -math.pi / 2, 0.4),  # x-axis up
+        tf.transformations.quaternion_from_euler(math.pi / 2, 0, 0.7),  # y-axis up
+        tf.transformations.quaternion_from_euler(0.5, 0.6, 0.2),  # tilted
+    )
+
+    def test_yaw_axes(self):
+
+        axes, angles = conversions.yaw_axes(self.QUATERNIONS)
+
+        self.assertEquals(list(axes[:3]), [2, 0, 1], "test_yaw_axes")
+
+        for q, ax, angle in zip(self.QUATERNIONS, axes, angles):
+
+            ref_ax, ref_angle = yaw_axis_reference(q)
+
+            self.assertEquals(ax, ref_ax, "test_yaw_axes")
+            self.assertAlmostEquals(angle, ref_angle, 6, "test_yaw_axes")
+
+    def test_yaw_axes_single(self):
+
+        axes, angles = conversions.yaw_axes([self.QUATERNIONS[0]])
+
+        self.assertEquals(len(axes), 1, "test_yaw_axes_single")
+        self.assertAlmostEquals(angles[0], 0.5, 6, "test_yaw_axes_single")
+
+
+if __name__ == '__main__':
+
+    import rosunit
+    rosunit.unitrun('art_projected_gui', 'test_conversions', TestConversions)
@@ -82,6 +82,106 @@ class TestUICore(unittest.TestCase):
 
         self.assertEquals(self.ui_core.remove_object("id1"), False, "test_remove_object")
 
+    def test_select_object(self):
+
+        self.ui_core.add_object("id1", self.type1, 0.5, 0.5, 0.0, [0, 0, 0, 1])
+        self.ui_core.add_object("id2", self.type1, 0.5, 0.5, 0.0, [0, 0, 0, 1])
+
+        self.ui_core.select_object("id1")
+
+        self.assertEquals(self.ui_core.get_object("id1").selected, True, "test_select_object")
+        self.assertEquals(self.ui_core.get_object("id2").selected, False, "test_select_object")
+
+        self.ui_core.select_object("id2")
+
+        self.assertEquals(self.ui_core.get_object("id1").selected, False, "test_select_object")
+        self.assertEquals(self.ui_core.get_object("id2").selected, True, "test_select_object")
+
+        self.ui_core.select_object("id1", unselect_others=False)
+
+        self.assertEquals(self.ui_core.get_object("id1").selected, True, "test_select_object")
+        self.assertEquals(self.ui_core.get_object("id2").selected, True, "test_select_object")
+
+        # object added later should be selected as well
+        self.ui_core.add_object("id3", self.type2, 0.5, 0.5, 0.0, [0, 0, 0, 1])
+        self.ui_core.select_object("id4", unselect_others=False)
+        self.ui_core.add_object("id4", self.type2, 0.5, 0.5, 0.0, [0, 0, 0, 1])
+
+        self.assertEquals(self.ui_core.get_object("id3").selected, False, "test_select_object")
+        self.assertEquals(self.ui_core.get_object("id4").selected, True, "test_select_object")
+
+    def test_get_objects(self):
+
+        self.ui_core.add_object("id1", self.type1, 0.5, 0.5, 0.0, [0, 0, 0, 1])
+        self.ui_core.add_object("id2", self.type2, 0.5, 0.5, 0.0, [0, 0, 0, 1])
+        self.ui_core.add_object("id3", self.type2, 0.5, 0.5, 0.0, [0, 0, 0, 1])
+        self.ui_core.add_place("caption", self.ps, self.type1)
+
+        self.assertEquals(len(list(self.ui_core.get_objects())), 3, "test_get_objects")
+        self.assertEquals(set([o.object_id for o in self.ui_core.get_objects("type2")]), set(["id2", "id3"]),
+                          "test_get_objects")
+
+        self.ui_core.remove_object("id2")
+
+        self.assertEquals([o.object_id for o in self.ui_core.get_objects("type2")], ["id3"], "test_get_objects")
+
+        self.ui_core.remove_object("id3")
+
+        self.assertEquals(list(self.ui_core.get_objects("type2")), [], "test_get_objects")
+
+        # adding object with already used ID replaces the old one
+        self.ui_core.add_object("id1", self.type2, 0.5, 0.5, 0.0, [0, 0, 0, 1])
+
+        self.assertEquals(len(list(self.ui_core.get_scene_items_by_type(ObjectItem))), 1, "test_get_objects")
+        self.assertEquals(list(self.ui_core.get_objects("type1")), [], "test_get_objects")
+
+    def test_object_pos_epsilon(self):
+
+        self.ui_core.object_pos_epsilon = 0.01
+        self.ui_core.add_object("id1", self.type1, 0.5, 0.5, 0.0, [0, 0, 0, 1])
+
+        obj = self.ui_core.get_object("id1")
+
+        obj.set_pos(0.505, 0.5, 0.0)
+        self.assertEquals(obj.position[0], 0.5, "test_object_pos_epsilon")
+
+        obj.set_pos(0.52, 0.5, 0.0)
+        self.assertEquals(obj.position[0], 0.52, "test_object_pos_epsilon")
+
+    def test_object_smoothing(self):
+
+        self.ui_core.object_smoothing = "interpolate"
+        self.ui_core.add_object("id1", self.type1, 0.5, 0.5, 0.0, [0, 0, 0, 1])
+
+        obj = self.ui_core.get_object("id1")
+
+        self.ui_core.move_object(obj, 0.5, 0.5, 0.0, [0, 0, 0, 1], stamp=1.0)
+        self.ui_core.move_object(obj, 0.6, 0.5, 0.0, [0, 0, 0, 1], stamp=1.1)
+
+        self.assertEquals(obj.position[0], 0.6, "test_object_smoothing")
+        self.assertAlmostEquals(obj.get_pos()[0], 0.5, 3, "test_object_smoothing")
+        self.assertEquals(obj in self.ui_core.animated_objects, True, "test_object_smoothing")
+
+        self.assertEquals(obj.animate(obj.motion[0] + 0.1), False, "test_object_smoothing")
+        self.assertAlmostEquals(obj.get_pos()[0], 0.6, 3, "test_object_smoothing")
+
+    def test_static_object_not_animated(self):
+
+        self.ui_core.object_smoothing = "interpolate"
+        self.ui_core.object_pos_epsilon = 0.01
+        self.ui_core.add_object("id1", self.type1, 0.5, 0.5, 0.0, [0, 0, 0, 1])
+
+        obj = self.ui_core.get_object("id1")
+
+        self.ui_core.move_object(obj, 0.5, 0.5, 0.0, [0, 0, 0, 1], stamp=1.0)
+        self.ui_core.move_object(obj, 0.5, 0.5, 0.0, [0, 0, 0, 1], stamp=1.1)
+
+        # change below epsilon is ignored as well
+        self.ui_core.move_object(obj, 0.505, 0.5, 0.0, [0, 0, 0, 1], stamp=1.2)
+
+        self.assertEquals(obj.motion, None, "test_static_object_not_animated")
+        self.assertEquals(obj in self.ui_core.animated_objects, False, "test_static_object_not_animated")
+
     def test_get_by_type(self):
 
         self.ui_core.add_object("id1", self.type1, 0.5, 0.5, 0.0, [0, 0, 0, 1])
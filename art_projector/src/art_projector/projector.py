@@ -80,6 +80,12 @@ class Projector(SceneViewer):
         self.map_x = None
         self.map_y = None
 
+        # ids of projectors sharing (part of) the scene with this one
+        self.blend_with = rospy.get_param('~blend_with', [])
+        self.blend_mask = None
+        self.blend_peers = {}
+        self.h_matrix = None
+
         self.dx = None
         self.dy = None
         self.scaled_checkerboard_width = None
@@ -103,6 +109,9 @@ class Projector(SceneViewer):
         self.move(geometry.left(), geometry.top())
         self.resize(geometry.width(), geometry.height())
 
+        # other projectors need it in order to compute blending masks
+        rospy.set_param("~resolution", [geometry.width(), geometry.height()])
+
         self.tfl = None
         self.bridge = CvBridge()
 
@@ -142,11 +151,18 @@ class Projector(SceneViewer):
             rospy.loginfo('Loaded calibration from param.')
             self.calibrated = True
             self.calibrated_pub.publish(self.is_calibrated())
+            self.h_matrix = np.matrix(ast.literal_eval(h_matrix))
 
             try:
                 with open(self.map_path, 'rb') as f:
 
-                    self.map_x, self.map_y = pickle.load(f)
+                    data = pickle.load(f)
+                    self.map_x, self.map_y = data[:2]
+
+                    # older files contain just maps
+                    if len(data) > 2:
+                        self.blend_mask, self.blend_peers = data[2:]
+
                     self.maps_ready = True
                     rospy.loginfo("Map loaded from file")
 
@@ -154,7 +170,7 @@ class Projector(SceneViewer):
                 rospy.logwarn("Failed to load map from file")
 
             if not self.maps_ready:
-                self.init_map_from_matrix(np.matrix(ast.literal_eval(h_matrix)))
+                self.init_map_from_matrix(self.h_matrix)
         else:
 
             try:
@@ -176,6 +192,8 @@ class Projector(SceneViewer):
         self.map_x = np.zeros((Hd, Wd), np.float32)
         self.map_y = np.zeros((Hd, Wd), np.float32)
 
+        # blending mask needs the original (scene -> projector) matrix
+        h_matrix = np.asarray(m)
         m = np.linalg.inv(m)
 
         for y in range(0, int(Hd - 1)):
@@ -187,17 +205,119 @@ class Projector(SceneViewer):
 
         self.map_x, self.map_y = cv2.convertMaps(
             self.map_x, self.map_y, cv2.CV_16SC2)
+
+        self.init_blend_mask(h_matrix, self.get_blend_peers())
         self.maps_ready = True
 
+        self.store_maps()
+
+        rospy.loginfo("Done!")
+
+    def store_maps(self):
+
         try:
             with open(self.map_path, 'wb') as f:
 
-                pickle.dump((self.map_x, self.map_y), f)
+                pickle.dump((self.map_x, self.map_y, self.blend_mask, self.blend_peers), f)
 
         except (IOError, OSError) as e:
             rospy.logerr("Failed to store map to file: " + str(e))
 
-        rospy.loginfo("Done!")
+    def get_blend_peers(self):
+        """Returns calibration matrices and resolutions of calibrated projectors listed in ~blend_with."""
+
+        peers = {}
+
+        for proj_id in self.blend_with:
+
+            ns = '/art/' + proj_id + '/projector/'
+
+            h_matrix = rospy.get_param(ns + 'calibration_matrix', None)
+            resolution = rospy.get_param(ns + 'resolution', None)
+
+            if h_matrix is None or resolution is None:
+                rospy.logwarn("Projector '" + proj_id + "' not calibrated yet - ignored for blending.")
+                continue
+
+            peers[proj_id] = (h_matrix, resolution)
+
+        return peers
+
+    @staticmethod
+    def edge_distance(m, sx, sy, width, height):
+        """Distance (in projector pixels) of scene points to the nearest edge of the projector's image.
+
+        Points outside of the image have zero distance.
+        """
+
+        w = m[2, 0] * sx + m[2, 1] * sy + m[2, 2]
+        px = (m[0, 0] * sx + m[0, 1] * sy + m[0, 2]) / w
+        py = (m[1, 0] * sx + m[1, 1] * sy + m[1, 2]) / w
+
+        dist = np.minimum(np.minimum(px, width - px), np.minimum(py, height - py))
+        dist[w <= 0] = 0
+
+        return np.clip(dist, 0, None)
+
+    def init_blend_mask(self, m, peers):
+        """Computes per-pixel weights (uint8, 255 = full brightness) for areas shared with other projectors.
+
+        Each projector contributes to a scene point proportionally to the point's distance from the edge
+        of its image (feathering), so that the overall brightness stays the same within overlaps.
+        """
+
+        self.blend_peers = peers
+
+        if not peers:
+            self.blend_mask = None
+            return
+
+        rospy.loginfo("Building blending mask for projector(s): " + str(peers.keys()))
+
+        Hd = self.height()
+        Wd = self.width()
+
+        m = np.asarray(m)
+        m_inv = np.linalg.inv(m)
+
+        ys, xs = np.mgrid[0:Hd, 0:Wd].astype(np.float64)
+
+        # projector pixels -> scene pixels
+        w = m_inv[2, 0] * xs + m_inv[2, 1] * ys + m_inv[2, 2]
+        sx = (m_inv[0, 0] * xs + m_inv[0, 1] * ys + m_inv[0, 2]) / w
+        sy = (m_inv[1, 0] * xs + m_inv[1, 1] * ys + m_inv[1, 2]) / w
+
+        own = self.edge_distance(m, sx, sy, Wd, Hd)
+        total = own.copy()
+
+        for h_matrix, resolution in peers.values():
+            total += self.edge_distance(np.asarray(ast.literal_eval(h_matrix)), sx, sy,
+                                        resolution[0], resolution[1])
+
+        mask = np.ones((Hd, Wd), np.float64)
+        np.divide(own, total, out=mask, where=total > 0)
+
+        # nothing is displayed outside of the scene
+        in_scene = (sx >= 0) & (sx < self.scene_size[0] * self.rpm) &\
+                   (sy >= 0) & (sy < self.scene_size[1] * self.rpm)
+        mask[~in_scene] = 1.0
+
+        mask = np.rint(mask * 255).astype(np.uint8)
+        self.blend_mask = cv2.merge([mask, mask, mask])
+
+    def update_blend_mask(self):
+        """Rebuilds blending mask if calibration of any of the other projectors has changed."""
+
+        if not self.maps_ready or self.h_matrix is None:
+            return
+
+        peers = self.get_blend_peers()
+
+        if peers == self.blend_peers:
+            return
+
+        self.init_blend_mask(self.h_matrix, peers)
+        self.store_maps()
 
     def show_pix_label_evt(self, show):
 
@@ -210,6 +330,10 @@ class Projector(SceneViewer):
     def projectors_calibrated_cb(self, msg):
 
         self.projectors_calibrated = msg.data
+
+        if self.projectors_calibrated:
+            self.update_blend_mask()
+
         self.emit(QtCore.SIGNAL('show_pix_label'), self.projectors_calibrated)
 
     def get_image(self, pix):
@@ -224,6 +348,11 @@ class Projector(SceneViewer):
         # TODO some further optimalization? this is about 30ms (with INTER_LINEAR)s...
         image_np = cv2.remap(v, self.map_x, self.map_y, cv2.INTER_LINEAR)
 
+        # attenuate areas shared with other projectors (in place, single pass)
+        blend_mask = self.blend_mask
+        if blend_mask is not None:
+            cv2.multiply(image_np, blend_mask, dst=image_np, scale=1.0 / 255)
+
         # this is about 3ms
         height, width, channel = image_np.shape
         bytesPerLine = 3 * width
@@ -337,6 +466,7 @@ class Projector(SceneViewer):
             np.array(points), np.array(ppoints), cv2.LMEDS)
 
         h_matrix = np.matrix(h)
+        self.h_matrix = h_matrix
 
         self.emit(QtCore.SIGNAL('show_pix_label'), False)  # hide chessboard
         self.calibrating = False
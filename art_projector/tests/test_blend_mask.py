@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+import unittest
+import numpy as np
+from art_projector.projector import Projector
+
+# scene pixels -> projector pixels
+H_MATRIX = np.matrix([[0.5, 0.02, 10.0], [0.01, 0.5, 5.0], [0.0, 0.0001, 1.0]])
+PEER_H_MATRIX = str([[0.5, 0.0, -20.0], [0.0, 0.5, 5.0], [0.0, 0.0, 1.0]])
+
+
+class FakeProjector(object):
+    """Mask related methods of Projector, without the widget and ROS stuff."""
+
+    init_map_from_matrix = Projector.__dict__["init_map_from_matrix"]
+    init_blend_mask = Projector.__dict__["init_blend_mask"]
+    update_blend_mask = Projector.__dict__["update_blend_mask"]
+    edge_distance = Projector.__dict__["edge_distance"]
+
+    def __init__(self):
+
+        self.h_matrix = H_MATRIX
+        self.maps_ready = False
+        self.blend_mask = None
+        self.blend_peers = {}
+        self.scene_size = (1.0, 0.8)
+        self.rpm = 200
+        self.peers = {"peer": (PEER_H_MATRIX, [80, 60])}
+
+    def width(self):
+
+        return 80
+
+    def height(self):
+
+        return 60
+
+    def get_blend_peers(self):
+
+        return dict(self.peers)
+
+    def store_maps(self):
+
+        pass
+
+
+class TestBlendMask(unittest.TestCase):
+
+    def test_same_mask_on_both_paths(self):
+
+        proj = FakeProjector()
+        proj.init_map_from_matrix(proj.h_matrix)
+
+        from_map = proj.blend_mask.copy()
+
+        # peer calibration changed (and back) -> mask is rebuilt by update_blend_mask
+        proj.blend_peers = {}
+        proj.update_blend_mask()
+
+        self.assertTrue(np.array_equal(from_map, proj.blend_mask), "test_same_mask_on_both_paths")
+
+        # there is an overlap - not everything has full brightness
+        self.assertLess(proj.blend_mask.min(), 255, "test_same_mask_on_both_paths")
+
+
+if __name__ == '__main__':
+
+    import rosunit
+    rosunit.unitrun('art_projector', 'test_blend_mask', TestBlendMask)